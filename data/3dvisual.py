@@ -1,19 +1,31 @@
 import glob
+import os
+import sys
 import numpy as np
 import openmc
 import plotly.graph_objects as go
 from plotly.offline import plot
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'models', 'FusionFissionReactor', 'Iteration1'))
+from catalog import CATALOG_DB, RunCatalog
+
 # --- config: must match tally ---
 dims = (60, 60, 60)
 r_cm  = 45.72
 R_vis = r_cm + 50.0
 
 # --- statepoint ---
-candidates = sorted(glob.glob("statepoint.*.h5") + glob.glob("../statepoint.*.h5"))
-if not candidates:
-    raise FileNotFoundError("No statepoint.*.h5 found—run neutronsource.py first.")
-sp = openmc.StatePoint(candidates[-1])
+# Newest cataloged statepoint that has the flux_3d tally, else the newest file on disk
+path = None
+if os.path.exists(CATALOG_DB):
+    with RunCatalog() as catalog:
+        path = catalog.latest('statepoint', tally='flux_3d')
+if path is None:
+    candidates = glob.glob("statepoint.*.h5") + glob.glob("../statepoint.*.h5")
+    if not candidates:
+        raise FileNotFoundError("No statepoint.*.h5 found—run neutronsource.py first.")
+    path = max(candidates, key=os.path.getmtime)
+sp = openmc.StatePoint(path)
 
 # --- data ---
 t = sp.get_tally(name="flux_3d")
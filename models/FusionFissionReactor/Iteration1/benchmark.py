@@ -0,0 +1,233 @@
+import openmc
+import openmc.deplete
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from blanket import build_u238_sphere
+from fuel_blanket import build_spentfuelsphere_albox
+from neutronsource import create_cylindrical_source
+from timing import peak_rss_mb
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# The other benchmarked models live in their own directories; import their
+# builders rather than copies so the benchmarks follow the models
+sys.path.append(os.path.join(HERE, '..', '..', 'Waste Disposal'))
+sys.path.append(os.path.join(HERE, '..', '..', 'NeutronSource'))
+from waste import build_waste_model
+from NeutronSinU import build_geometry as build_sinu_geometry
+
+BASELINE_FILE = os.path.join(HERE, "benchmark_baseline.json")
+BENCH_DATA_DIR = os.path.join(HERE, "benchmark_data")
+
+# Reduced statistics so the whole suite runs in a few minutes
+BENCH_PARTICLES = 2_000
+BENCH_BATCHES = 4
+
+
+def _fixed_source_settings(source):
+    settings = openmc.Settings()
+    settings.run_mode = 'fixed source'
+    settings.particles = BENCH_PARTICLES
+    settings.batches = BENCH_BATCHES
+    settings.source = source
+    return settings
+
+
+def _zpinch():
+    return create_cylindrical_source(height=5.0, radius=1.0, e_min=2.3e6, e_max=2.5e6)
+
+
+def u238_sphere():
+    geometry, materials = build_u238_sphere(sphere_radius=25.5, world_padding=50.0)
+    return openmc.Model(geometry, materials, _fixed_source_settings(_zpinch()))
+
+
+def spentfuel_albox():
+    geometry, materials = build_spentfuelsphere_albox(20.0, 20.0, 50.0, 100.0)
+
+    # Same 80^3 heating mesh as reactor.py, since it is part of what we track
+    mesh = openmc.RegularMesh()
+    mesh.dimension = (80, 80, 80)
+    mesh.lower_left = [-50.0, -50.0, -50.0]
+    mesh.upper_right = [50.0, 50.0, 50.0]
+    heating_tally = openmc.Tally(name="3d_heating_tally")
+    heating_tally.filters = [openmc.MeshFilter(mesh)]
+    heating_tally.scores = ["heating"]
+
+    return openmc.Model(geometry, materials, _fixed_source_settings(_zpinch()), openmc.Tallies([heating_tally]))
+
+
+def waste_cylinder():
+    # waste.py (spent fuel wall around a 2.45 MeV line source) at benchmark statistics
+    model = build_waste_model()
+    model.settings = _fixed_source_settings(model.settings.source)
+    return model
+
+
+def neutron_s_in_u():
+    # NeutronSinU.py: 90% enriched U sphere in a water shell, eigenvalue mode
+    geometry, materials, _ = build_sinu_geometry()
+    settings = openmc.Settings()
+    settings.temperature = {'method': 'interpolation'}
+    settings.particles = BENCH_PARTICLES
+    settings.batches = BENCH_BATCHES + 2
+    settings.inactive = 2
+    settings.source = openmc.IndependentSource(space=openmc.stats.Point((0, 0, 0)))
+    return openmc.Model(geometry, materials, settings)
+
+
+CASES = {
+    'u238_sphere': u238_sphere,
+    'spentfuel_albox': spentfuel_albox,
+    'waste_cylinder': waste_cylinder,
+    'neutron_s_in_u': neutron_s_in_u,
+}
+
+
+def make_bench_library(source_library=None, dest=BENCH_DATA_DIR):
+    """
+    Copies only the nuclides the benchmark models use from the full library
+    into a small local library, so the suite runs offline without the 3 GB
+    ENDF/B-VIII.0 download. Returns the new cross_sections.xml path.
+
+    The library is built from OPENMC_CROSS_SECTIONS on the first run (it is
+    too large to keep in git); later runs only need benchmark_data/.
+    """
+
+    import shutil
+
+    source_library = source_library or os.environ.get("OPENMC_CROSS_SECTIONS")
+    if not source_library or not os.path.exists(source_library):
+        raise RuntimeError(f"No {dest}/cross_sections.xml yet: set OPENMC_CROSS_SECTIONS to a full "
+                           "library once so the benchmark library can be built from it")
+    full = openmc.data.DataLibrary.from_xml(source_library)
+    needed = set()
+    for build in CASES.values():
+        for mat in build().materials:
+            needed.update(name for name, _, _ in mat.nuclides)
+
+    os.makedirs(dest, exist_ok=True)
+    subset = openmc.data.DataLibrary()
+    for entry in full.libraries:
+        if entry['type'] == 'neutron' and set(entry['materials']) & needed:
+            target = os.path.join(dest, os.path.basename(entry['path']))
+            if not os.path.exists(target):
+                shutil.copyfile(entry['path'], target)
+            subset.register_file(target)
+    xml = os.path.join(dest, "cross_sections.xml")
+    subset.export_to_xml(xml)
+    print(f"Benchmark library with {len(subset.libraries)} nuclides written to {xml}")
+    return xml
+
+
+def run_case(name):
+    """
+    Runs one benchmark case in this process's working directory.
+    Returns: init time, particles/sec (active batches), peak RSS and,
+    for depletable models with a chain file, one depletion step time.
+    """
+
+    model = CASES[name]()
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        sp_path = model.run(cwd=tmp, output=False)
+        wall = time.perf_counter() - start
+        with openmc.StatePoint(sp_path, autolink=False) as sp:
+            runtime = dict(sp.runtime)
+            n_active = sp.n_batches - (sp.n_inactive or 0)
+        metrics = {
+            'wall_s': wall,
+            'init_s': runtime['total initialization'],
+            'particles_per_s': model.settings.particles * n_active / runtime['active batches'],
+        }
+
+        chain = openmc.config.get('chain_file')
+        if chain and any(m.depletable for m in model.materials):
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                operator = openmc.deplete.CoupledOperator(model, chain_file=chain, normalization_mode="source-rate")
+                integrator = openmc.deplete.PredictorIntegrator(operator, [86400.0], source_rates=[1.0e15])
+                start = time.perf_counter()
+                integrator.integrate(final_step=False, output=False)
+                metrics['depletion_step_s'] = time.perf_counter() - start
+            finally:
+                os.chdir(cwd)
+
+    metrics['peak_rss_mb'] = peak_rss_mb()
+    return metrics
+
+
+def run_suite(cases=None):
+    # Every case runs in a fresh interpreter so its peak RSS is its own
+    suite = {}
+    for name in cases or CASES:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--case', name],
+                             capture_output=True, text=True, check=True)
+        suite[name] = json.loads(out.stdout.strip().splitlines()[-1])
+        m = suite[name]
+        print(f"{name:18s} {m['particles_per_s']:10.0f} particles/s  init {m['init_s']:6.2f} s  "
+              f"peak {m['peak_rss_mb']:7.1f} MB" +
+              (f"  depletion step {m['depletion_step_s']:.2f} s" if 'depletion_step_s' in m else ""))
+    return suite
+
+
+def compare(suite, baseline, threshold=0.10):
+    """
+    Returns a list of regressions: throughput below (1 - threshold) of the
+    baseline, or init time / memory / depletion step above (1 + threshold).
+    """
+
+    failures = []
+    for name, m in suite.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if m['particles_per_s'] < (1.0 - threshold) * base['particles_per_s']:
+            failures.append(f"{name}: {m['particles_per_s']:.0f} particles/s vs baseline {base['particles_per_s']:.0f}")
+        for key in ('init_s', 'peak_rss_mb', 'depletion_step_s'):
+            if key in m and key in base and m[key] > (1.0 + threshold) * base[key]:
+                failures.append(f"{name}: {key} {m[key]:.2f} vs baseline {base[key]:.2f}")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput/memory benchmarks for the project's reference models")
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    parser.add_argument('--make-data', action='store_true', help='Build the small offline library from OPENMC_CROSS_SECTIONS')
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Allowed relative slowdown (default: 0.10)')
+    args = parser.parse_args()
+
+    if args.make_data:
+        make_bench_library()
+        sys.exit(0)
+
+    # Always run against the small local library (offline), building it on first use
+    bench_xs = os.path.join(BENCH_DATA_DIR, "cross_sections.xml")
+    if not os.path.exists(bench_xs) and not args.case:
+        make_bench_library()
+    openmc.config['cross_sections'] = bench_xs
+
+    if args.case:
+        print(json.dumps(run_case(args.case)))
+        sys.exit(0)
+
+    suite = run_suite()
+    if args.update_baseline or not os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(suite, f, indent=2)
+        print(f"Baseline written to {BASELINE_FILE}")
+        sys.exit(0)
+
+    with open(BASELINE_FILE) as f:
+        failures = compare(suite, json.load(f), args.threshold)
+    if failures:
+        print("PERFORMANCE REGRESSION:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("All benchmarks within threshold of baseline.")
@@ -35,12 +35,7 @@ def build_u238_sphere(sphere_radius, world_padding=50.0):
     world_boundary = openmc.Sphere(r=world_radius, boundary_type='reflective')
 
     # Cells
-    inner_vacuum_cell2 = openmc.Cell(
-        name='inner_vacuum',
-        region=-inner_surface
-    )
-
-    inner_vacuum_cell = openmc.Cell()
+    inner_vacuum_cell = openmc.Cell(name='inner_vacuum')
     inner_vacuum_cell.region = -inner_surface
     inner_vacuum_cell.fill = Na
 
@@ -0,0 +1,232 @@
+import openmc
+import numpy as np
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+
+CATALOG_DB = "run_catalog.sqlite"
+INPUT_FILES = ('geometry.xml', 'materials.xml', 'settings.xml', 'tallies.xml')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    kind TEXT,
+    input_hash TEXT,
+    parameters TEXT,
+    directory TEXT,
+    started REAL,
+    finished REAL
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    run_id INTEGER REFERENCES runs(id),
+    kind TEXT,
+    path TEXT,
+    step INTEGER
+);
+CREATE TABLE IF NOT EXISTS tallies (
+    run_id INTEGER REFERENCES runs(id),
+    step INTEGER,
+    tally TEXT,
+    score TEXT,
+    total REAL,
+    std_dev REAL,
+    n_bins INTEGER
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER REFERENCES runs(id),
+    step INTEGER,
+    phase TEXT,
+    seconds REAL
+);
+CREATE INDEX IF NOT EXISTS runs_name ON runs(name, finished);
+CREATE INDEX IF NOT EXISTS runs_hash ON runs(input_hash);
+CREATE INDEX IF NOT EXISTS outputs_run ON outputs(run_id, kind);
+CREATE INDEX IF NOT EXISTS tallies_lookup ON tallies(tally, score, run_id);
+"""
+
+
+def input_hash(directory='.'):
+    """
+    Short SHA-256 of the XML inputs openmc actually read (geometry, materials,
+    settings, tallies), so runs of identical models share a hash.
+    """
+
+    digest = hashlib.sha256()
+    for name in INPUT_FILES:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def tally_summaries(statepoint_path):
+    """
+    Per tally and score: total over all bins/nuclides, its standard deviation
+    and the number of bins. Read once at completion so later queries do not
+    have to open the statepoint.
+    """
+
+    rows = []
+    with openmc.StatePoint(statepoint_path, autolink=False) as sp:
+        for tally in sp.tallies.values():
+            mean = tally.mean.reshape(-1, len(tally.scores))
+            var = tally.std_dev.reshape(-1, len(tally.scores))**2
+            for j, score in enumerate(tally.scores):
+                rows.append((tally.name, score, float(mean[:, j].sum()), float(np.sqrt(var[:, j].sum())),
+                             int(mean.shape[0])))
+    return rows
+
+
+def _step(path):
+    # openmc_simulation_n<i>.h5 -> i; other files have no step
+    match = re.search(r"_n(\d+)\.h5$", os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+
+class RunCatalog:
+    """
+    SQLite index of finished runs: parameters, input hash, output files,
+    tally summaries and phase timings.
+
+    - record() is called once when a run completes
+    - latest()/outputs()/find_runs() replace directory globbing
+    - tally_history() returns summary values without opening any statepoint
+    """
+
+    def __init__(self, path=CATALOG_DB):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def record(self, name, parameters=None, outputs=None, timings=None, kind='transport',
+               directory='.', started=None, summarize=True):
+        """
+        Adds one run.
+
+        - outputs: {kind: path or list of paths}, e.g. {'statepoint': [...],
+          'depletion_results': 'depletion_results.h5'}; depletion step
+          statepoints get their step index from the file name
+        - timings: list of Timeline events (dicts with phase/step/seconds)
+        - summarize: store tally summaries of every 'statepoint' output
+        - Returns: run id
+        """
+
+        cur = self.db.execute(
+            "INSERT INTO runs (name, kind, input_hash, parameters, directory, started, finished) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, kind, input_hash(directory), json.dumps(parameters or {}, default=str),
+             os.path.abspath(directory), started, time.time()))
+        run_id = cur.lastrowid
+
+        for out_kind, paths in (outputs or {}).items():
+            paths = [paths] if isinstance(paths, str) else list(paths)
+            self.db.executemany("INSERT INTO outputs VALUES (?, ?, ?, ?)",
+                                [(run_id, out_kind, os.path.abspath(p), _step(p)) for p in paths])
+            if summarize and out_kind == 'statepoint':
+                for p in paths:
+                    self.db.executemany("INSERT INTO tallies VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                        [(run_id, _step(p)) + row for row in tally_summaries(p)])
+
+        if timings:
+            self.db.executemany("INSERT INTO timings VALUES (?, ?, ?, ?)",
+                                [(run_id, e.get('step'), e['phase'], e['seconds']) for e in timings])
+        self.db.commit()
+        return run_id
+
+    def find_runs(self, name=None, kind=None, input_hash=None, **parameters):
+        """
+        Runs matching the given fields and parameter values, newest first.
+        Returns: list of dicts
+        """
+
+        query, args = "SELECT id, name, kind, input_hash, parameters, directory, started, finished FROM runs WHERE 1", []
+        for column, value in (('name', name), ('kind', kind), ('input_hash', input_hash)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                args.append(value)
+        for key, value in parameters.items():
+            query += " AND json_extract(parameters, ?) = ?"
+            args += [f"$.{key}", value]
+        rows = self.db.execute(query + " ORDER BY finished DESC", args).fetchall()
+        keys = ('id', 'name', 'kind', 'input_hash', 'parameters', 'directory', 'started', 'finished')
+        runs = [dict(zip(keys, row)) for row in rows]
+        for run in runs:
+            run['parameters'] = json.loads(run['parameters'])
+        return runs
+
+    def outputs(self, run_id, kind=None):
+        # Output paths of one run, in step order
+        query, args = "SELECT path FROM outputs WHERE run_id = ?", [run_id]
+        if kind is not None:
+            query += " AND kind = ?"
+            args.append(kind)
+        return [row[0] for row in self.db.execute(query + " ORDER BY step", args)]
+
+    def latest(self, kind, name=None, tally=None):
+        """
+        Newest output of `kind` (optionally from runs called `name`, or
+        statepoints containing `tally`). Returns: path or None
+        """
+
+        query = ("SELECT o.path FROM outputs o JOIN runs r ON r.id = o.run_id WHERE o.kind = ?")
+        args = [kind]
+        if name is not None:
+            query += " AND r.name = ?"
+            args.append(name)
+        if tally is not None:
+            query += " AND EXISTS (SELECT 1 FROM tallies t WHERE t.run_id = o.run_id AND t.tally = ?)"
+            args.append(tally)
+        row = self.db.execute(query + " ORDER BY r.finished DESC, o.step DESC LIMIT 1", args).fetchone()
+        return row[0] if row else None
+
+    def tally_history(self, tally, score, run_id=None, name=None):
+        """
+        (step, total, std_dev) rows of a tally summary for one run (default:
+        the newest run called `name`, or the newest run overall).
+        """
+
+        if run_id is None:
+            runs = self.find_runs(name=name)
+            if not runs:
+                return []
+            run_id = runs[0]['id']
+        return self.db.execute("SELECT step, total, std_dev FROM tallies WHERE run_id = ? AND tally = ? "
+                               "AND score = ? ORDER BY step", (run_id, tally, score)).fetchall()
+
+    def timings(self, run_id):
+        return self.db.execute("SELECT step, phase, seconds FROM timings WHERE run_id = ? ORDER BY rowid",
+                               (run_id,)).fetchall()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List runs recorded in the run catalog")
+    parser.add_argument('--db', default=CATALOG_DB)
+    parser.add_argument('--name', default=None)
+    parser.add_argument('--tally', default=None, help='Also print this tally summary for each run')
+    parser.add_argument('--score', default='flux')
+    args = parser.parse_args()
+
+    with RunCatalog(args.db) as catalog:
+        for run in catalog.find_runs(name=args.name):
+            finished = time.strftime('%Y-%m-%d %H:%M', time.localtime(run['finished']))
+            print(f"[{run['id']}] {run['name']} ({run['kind']}) {finished} hash {run['input_hash']} "
+                  f"{len(catalog.outputs(run['id']))} outputs")
+            if args.tally:
+                for step, total, std in catalog.tally_history(args.tally, args.score, run_id=run['id']):
+                    print(f"    step {step}: {args.tally}/{args.score} = {total:.4e} +/- {std:.1e}")
@@ -0,0 +1,223 @@
+import openmc.data
+import numpy as np
+import argparse
+import h5py
+import os
+
+COMPACT_FILE = "depletion_compact.h5"
+
+# What results.py and the radial inventory actually read
+KEEP_NUCLIDES = ['U234', 'U235', 'U236', 'U238', 'Pu238', 'Pu239', 'Pu240', 'Pu241', 'Pu242', 'Am241',
+                 'Cm244', 'Cs137', 'Sr90']
+KEEP_REACTIONS = [('U238', 'fission'), ('U238', '(n,gamma)'), ('Pu239', 'fission'), ('Pu239', '(n,gamma)')]
+
+CHUNK_STEPS = 64
+
+
+def _appendable(group, name, shape, dtype, compress=False):
+    # Resizable along the step axis, one chunk per CHUNK_STEPS steps
+    if name in group:
+        return group[name]
+    kwargs = {'compression': 'gzip', 'shuffle': True} if compress else {}
+    return group.create_dataset(name, shape=(0,) + shape, maxshape=(None,) + shape, dtype=dtype,
+                                chunks=(CHUNK_STEPS,) + shape, **kwargs)
+
+
+def _append(dataset, values):
+    n = dataset.shape[0]
+    dataset.resize(n + 1, axis=0)
+    dataset[n] = values
+
+
+class CompactWriter:
+    """
+    Appendable, per-nuclide depletion store.
+
+    - Kept nuclides: one float64 dataset per material and nuclide, chunked
+      along steps, so a time series read touches only that nuclide
+    - Other nuclides: dropped, or one gzip-compressed float32 block per
+      material (others='compress'; ~7 significant digits)
+    - Kept reactions: one float64 dataset per material, nuclide and reaction
+    - append_step() adds one depletion step; re-opening the file resumes
+    """
+
+    def __init__(self, path=COMPACT_FILE, keep_nuclides=KEEP_NUCLIDES, keep_reactions=KEEP_REACTIONS,
+                 others='compress'):
+        if others not in ('compress', 'drop'):
+            raise ValueError("others must be 'compress' or 'drop'")
+        self.f = h5py.File(path, 'a')
+        self.keep_nuclides = list(keep_nuclides)
+        self.keep_reactions = [tuple(r) for r in keep_reactions]
+        self.others = others
+        self.f.attrs['keep_nuclides'] = np.array(self.keep_nuclides, dtype='S')
+
+    @property
+    def n_steps(self):
+        return self.f['time'].shape[0] if 'time' in self.f else 0
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def append_step(self, time, source_rate, atoms, rates=None, volumes=None):
+        """
+        - time: (start, end) of the step in s
+        - atoms: {material id: {nuclide: atoms}} for every nuclide in the chain
+        - rates: {material id: {(nuclide, reaction): reactions/s}}
+        - volumes: {material id: cm^3}, stored once as attributes
+        """
+
+        _append(_appendable(self.f, 'time', (2,), 'f8'), time)
+        _append(_appendable(self.f, 'source_rate', (), 'f8'), source_rate)
+
+        for mat_id, nuclide_atoms in atoms.items():
+            group = self.f.require_group(f"materials/{mat_id}")
+            if volumes and 'volume' not in group.attrs:
+                group.attrs['volume'] = volumes[mat_id]
+            for nuc in self.keep_nuclides:
+                _append(_appendable(group, nuc, (), 'f8'), nuclide_atoms.get(nuc, 0.0))
+
+            if self.others == 'compress':
+                if 'others' not in group:
+                    names = sorted(n for n in nuclide_atoms if n not in self.keep_nuclides)
+                    _appendable(group, 'others', (len(names),), 'f4', compress=True)
+                    group['others'].attrs['nuclides'] = np.array(names, dtype='S')
+                names = [n.decode() for n in group['others'].attrs['nuclides']]
+                _append(group['others'], np.array([nuclide_atoms.get(n, 0.0) for n in names], dtype='f4'))
+
+            for (nuc, rxn) in self.keep_reactions:
+                value = (rates or {}).get(mat_id, {}).get((nuc, rxn), 0.0)
+                _append(_appendable(group.require_group(f"rates/{nuc}"), rxn, (), 'f8'), value)
+        self.f.flush()
+
+
+def compact_results(results_path="depletion_results.h5", out_path=COMPACT_FILE,
+                    keep_nuclides=KEEP_NUCLIDES, keep_reactions=KEEP_REACTIONS, others='compress'):
+    """
+    Copies an openmc.deplete results file into the compact store, one step
+    at a time (only steps not already in out_path are appended, so it can
+    follow a running depletion). Returns: number of steps appended
+    """
+
+    with h5py.File(results_path, 'r') as f, \
+            CompactWriter(out_path, keep_nuclides, keep_reactions, others) as writer:
+        mats = {name: f['materials'][name].attrs['index'] for name in f['materials']}
+        volumes = {name: float(f['materials'][name].attrs['volume']) for name in f['materials']}
+        nucs = {name: f['nuclides'][name].attrs['atom number index'] for name in f['nuclides']
+                if 'atom number index' in f['nuclides'][name].attrs}
+        rate_nucs = {name: f['nuclides'][name].attrs['reaction rate index'] for name in f['nuclides']
+                     if 'reaction rate index' in f['nuclides'][name].attrs}
+        rxns = {name: f['reactions'][name].attrs['index'] for name in f['reactions']}
+
+        n_steps = f['number'].shape[0]
+        start = writer.n_steps
+        if start > n_steps or (start > 0 and not np.allclose(writer.f['time'][:start], f['time'][:start])):
+            raise ValueError(f"{out_path} holds steps of a different depletion run")
+        for step in range(start, n_steps):
+            # First (beginning-of-step) stage, as openmc.deplete.Results reports
+            number = f['number'][step, 0]
+            rr = f['reaction rates'][step, 0]
+            atoms = {m: {n: float(number[i, j]) for n, j in nucs.items()} for m, i in mats.items()}
+            rates = {m: {(n, r): float(rr[i, rate_nucs[n], k])
+                         for (n, r) in writer.keep_reactions if n in rate_nucs and r in rxns
+                         for k in [rxns[r]]}
+                     for m, i in mats.items()}
+            writer.append_step(f['time'][step], f['source_rate'][step, 0], atoms, rates, volumes)
+    return n_steps - start
+
+
+class CompactResults:
+    """
+    Read side of the compact store with the openmc.deplete.Results calls
+    results.py uses (get_times, get_atoms, get_mass, get_reaction_rate,
+    get_decay_heat). Kept nuclides read one chunked dataset per call.
+
+    - volume: {material id: cm^3}, as openmc.deplete.Results[0].volume
+    - source_rate: source rate [n/s] of each step
+    """
+
+    def __init__(self, path=COMPACT_FILE):
+        self.f = h5py.File(path, 'r')
+        self.volume = {mat: float(group.attrs['volume']) for mat, group in self.f['materials'].items()
+                       if 'volume' in group.attrs}
+        self.source_rate = self.f['source_rate'][:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        self.f.close()
+
+    def get_times(self, time_units='s'):
+        scale = {'s': 1.0, 'min': 60.0, 'h': 3600.0, 'd': 86400.0}[time_units]
+        return self.f['time'][:, 0] / scale
+
+    def _series(self, mat, path):
+        group = self.f[f"materials/{mat}"]
+        if path in group:
+            return group[path][:]
+        nuc = path
+        if 'others' in group:
+            names = [n.decode() for n in group['others'].attrs['nuclides']]
+            if nuc in names:
+                return group['others'][:, names.index(nuc)].astype(float)
+        raise KeyError(f"{path} is not stored for material {mat}")
+
+    def get_atoms(self, mat, nuc, nuc_units='atoms'):
+        atoms = self._series(mat, nuc)
+        if nuc_units == 'atom/b-cm':
+            atoms = atoms / self.f[f"materials/{mat}"].attrs['volume'] * 1.0e-24
+        return self.get_times(), atoms
+
+    def get_mass(self, mat, nuc, mass_units='g'):
+        times, atoms = self.get_atoms(mat, nuc)
+        grams = atoms * openmc.data.atomic_mass(nuc) / openmc.data.AVOGADRO
+        return times, grams / {'g': 1.0, 'kg': 1.0e3}[mass_units]
+
+    def get_reaction_rate(self, mat, nuc, rx):
+        return self.get_times(), self._series(mat, f"rates/{nuc}/{rx}")
+
+    def get_decay_heat(self, mat, units='W'):
+        """
+        Decay heat [W] from every stored nuclide, as Material.get_decay_heat.
+        Needs openmc.config['chain_file'] and a store written with
+        others='compress' (otherwise only kept nuclides contribute).
+        """
+
+        if units != 'W':
+            raise ValueError("Only units='W' is supported")
+        group = self.f[f"materials/{mat}"]
+        series = {nuc: group[nuc][:] for nuc in self.f.attrs['keep_nuclides'].astype(str) if nuc in group}
+        if 'others' in group:
+            block = group['others'][:].astype(float)
+            for j, nuc in enumerate(group['others'].attrs['nuclides'].astype(str)):
+                series[nuc] = block[:, j]
+
+        heat = np.zeros(self.f['time'].shape[0])
+        for nuc, atoms in series.items():
+            rate = openmc.data.decay_constant(nuc)
+            if rate > 0.0:
+                heat += atoms * rate * openmc.data.decay_energy(nuc) * openmc.data.JOULE_PER_EV
+        return self.get_times(), heat
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compact an openmc.deplete results file")
+    parser.add_argument('results', nargs='?', default="depletion_results.h5")
+    parser.add_argument('--out', default=COMPACT_FILE)
+    parser.add_argument('--drop-others', action='store_true', help='Drop unlisted nuclides instead of compressing them')
+    args = parser.parse_args()
+
+    n = compact_results(args.results, args.out, others='drop' if args.drop_others else 'compress')
+    print(f"Appended {n} steps to {args.out}: {os.path.getsize(args.results) / 1e6:.2f} MB -> "
+          f"{os.path.getsize(args.out) / 1e6:.2f} MB")
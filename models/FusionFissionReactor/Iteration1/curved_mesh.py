@@ -0,0 +1,117 @@
+import openmc
+import numpy as np
+
+
+def _grid_mesh(mesh_class, **grids):
+    # Newer openmc takes the grids in the constructor, older versions as attributes
+    try:
+        return mesh_class(**grids)
+    except TypeError:
+        mesh = mesh_class()
+        for name, values in grids.items():
+            setattr(mesh, name, values)
+        return mesh
+
+
+def _subdivide(edges, bins_per_interval):
+    # Split every [edge_i, edge_i+1] interval into equal bins, keeping the edges exact
+    fine = [np.linspace(a, b, bins_per_interval + 1)[:-1] for a, b in zip(edges[:-1], edges[1:])]
+    return np.append(np.concatenate(fine), edges[-1])
+
+
+def shell_radii(geometry):
+    """
+    Radii of all origin-centred spheres in the geometry (the model's shells).
+    """
+
+    return sorted({s.r for s in geometry.get_all_surfaces().values()
+                   if isinstance(s, openmc.Sphere) and (s.x0, s.y0, s.z0) == (0.0, 0.0, 0.0)})
+
+
+def cylinder_grid(geometry):
+    """
+    Radii of z-axis cylinders and heights of z-planes in the geometry.
+    """
+
+    surfaces = geometry.get_all_surfaces().values()
+    radii = sorted({s.r for s in surfaces if isinstance(s, openmc.ZCylinder) and (s.x0, s.y0) == (0.0, 0.0)})
+    heights = sorted({s.z0 for s in surfaces if isinstance(s, openmc.ZPlane)})
+    return radii, heights
+
+
+def aligned_mesh(geometry, bins_per_shell=10, n_theta=1, n_phi=1, n_z_per_interval=10):
+    """
+    Picks a SphericalMesh or CylindricalMesh whose bin edges coincide with the
+    model's spherical/cylindrical shells, so no bin straddles a shell boundary.
+    Cells bounded by other surfaces still share bins: in fuel_blanket the
+    innermost sphere holds both the Al box and the Na around it.
+
+    - z-cylinders + z-planes (waste.py): CylindricalMesh, r/z aligned
+    - origin-centred spheres (blanket, fuel_blanket, NeutronSinU): SphericalMesh
+    - n_theta/n_phi > 1 add angular resolution; 1 gives pure radial profiles
+    - Returns: openmc mesh
+    """
+
+    radii, heights = cylinder_grid(geometry)
+    if radii and len(heights) >= 2:
+        r_grid = _subdivide(np.array([0.0] + radii), bins_per_shell)
+        z_grid = _subdivide(np.array(heights), n_z_per_interval)
+        return _grid_mesh(openmc.CylindricalMesh, r_grid=r_grid, phi_grid=np.linspace(0.0, 2.0 * np.pi, n_phi + 1),
+                          z_grid=z_grid)
+
+    radii = shell_radii(geometry)
+    if not radii:
+        raise ValueError("Geometry has no origin-centred spheres or z-cylinders to align a mesh with")
+    r_grid = _subdivide(np.array([0.0] + radii), bins_per_shell)
+    return _grid_mesh(openmc.SphericalMesh, r_grid=r_grid, theta_grid=np.linspace(0.0, np.pi, n_theta + 1),
+                      phi_grid=np.linspace(0.0, 2.0 * np.pi, n_phi + 1))
+
+
+def aligned_mesh_tally(geometry, scores=('flux', 'heating'), name='radial_tally', **mesh_kwargs):
+    """
+    Builds a tally on aligned_mesh(geometry). Returns: openmc.Tally
+    """
+
+    tally = openmc.Tally(name=name)
+    tally.filters = [openmc.MeshFilter(aligned_mesh(geometry, **mesh_kwargs))]
+    tally.scores = list(scores)
+    return tally
+
+
+def _profile(statepoint, tally_name, score, keep_axis, source_rate):
+    sp = statepoint if isinstance(statepoint, openmc.StatePoint) else openmc.StatePoint(statepoint)
+    tally = sp.get_tally(name=tally_name)
+    mesh = tally.find_filter(openmc.MeshFilter).mesh
+    dim = tuple(mesh.dimension)
+    mean = tally.get_slice(scores=[score]).mean.reshape(dim, order='F')
+    var = tally.get_slice(scores=[score]).std_dev.reshape(dim, order='F')**2
+    volumes = np.asarray(mesh.volumes).reshape(dim)
+
+    # Volume-average over the two collapsed axes
+    other = tuple(i for i in range(3) if i != keep_axis)
+    vol = volumes.sum(axis=other)
+    profile = mean.sum(axis=other) / vol * source_rate
+    std = np.sqrt(var.sum(axis=other)) / vol * source_rate
+
+    grid = (mesh.r_grid, getattr(mesh, 'theta_grid', None), mesh.phi_grid) if isinstance(mesh, openmc.SphericalMesh) \
+        else (mesh.r_grid, mesh.phi_grid, mesh.z_grid)
+    edges = np.asarray(grid[keep_axis])
+    return 0.5 * (edges[1:] + edges[:-1]), profile, std
+
+
+def radial_profile(statepoint, tally_name='radial_tally', score='flux', source_rate=1.0):
+    """
+    Volume-averaged radial profile (per cm^3, times source_rate if given).
+    Returns: (r_centres, values, std_dev)
+    """
+
+    return _profile(statepoint, tally_name, score, 0, source_rate)
+
+
+def axial_profile(statepoint, tally_name='radial_tally', score='flux', source_rate=1.0):
+    """
+    Volume-averaged axial profile of a CylindricalMesh tally.
+    Returns: (z_centres, values, std_dev)
+    """
+
+    return _profile(statepoint, tally_name, score, 2, source_rate)
@@ -0,0 +1,100 @@
+import openmc
+import numpy as np
+
+PSV_TO_SV = 1.0e-12
+SECONDS_PER_HOUR = 3600.0
+
+
+def build_dose_tally(mesh, particle='neutron', geometry='AP', name='dose_tally'):
+    """
+    Builds a mesh tally that scores flux weighted by the ICRP-116
+    flux-to-dose conversion coefficients.
+
+    - mesh: any OpenMC mesh (RegularMesh, CylindricalMesh, SphericalMesh)
+    - geometry: irradiation geometry for the coefficients ('AP', 'PA', 'ISO', ...)
+    - Tally units: pSv-cm per source particle
+    - Returns: openmc.Tally
+    """
+
+    energies, coeffs = openmc.data.dose_coefficients(particle, geometry=geometry)
+    dose_filter = openmc.EnergyFunctionFilter(energies, coeffs)
+    dose_filter.interpolation = 'log-log'   # ICRP tables are smooth in log-log
+
+    tally = openmc.Tally(name=name)
+    tally.filters = [openmc.MeshFilter(mesh), openmc.ParticleFilter([particle]), dose_filter]
+    tally.scores = ['flux']
+    return tally
+
+
+def dose_rate_map(statepoint, source_rate, tally_name='dose_tally'):
+    """
+    Converts the dose tally of a statepoint into a 3D dose-rate array.
+
+    - statepoint: path to a statepoint file or an open openmc.StatePoint
+    - source_rate: physical source strength in neutrons/sec
+    - Returns: (dose_rate, std_dev, mesh), dose rates in Sv/h shaped like
+      mesh.dimension (x fastest, same ordering as mesh.vertices)
+    """
+
+    if not isinstance(statepoint, openmc.StatePoint):
+        with openmc.StatePoint(statepoint) as sp:
+            return dose_rate_map(sp, source_rate, tally_name)
+    sp = statepoint
+
+    tally = sp.get_tally(name=tally_name)
+    mesh = tally.find_filter(openmc.MeshFilter).mesh
+    dim = tuple(mesh.dimension)
+
+    # pSv-cm/source -> Sv/h per voxel: * S / V * 1e-12 * 3600 (all vectorized)
+    volumes = np.asarray(mesh.volumes, dtype=float)
+    scale = source_rate * PSV_TO_SV * SECONDS_PER_HOUR
+    mean = tally.mean.reshape(dim, order='F')
+    std_dev = tally.std_dev.reshape(dim, order='F')
+
+    dose_rate = mean * scale / volumes
+    dose_std = std_dev * scale / volumes
+    return dose_rate, dose_std, mesh
+
+
+def plot_isodose(dose_rate, mesh, levels, axis='z', index=None, filename='isodose.png'):
+    """
+    Saves isodose contours of a 2D slice through a dose-rate map.
+
+    - levels: dose rates in Sv/h at which to draw contours
+    - mesh: the RegularMesh the dose map was tallied on
+    - axis: slice normal ('x', 'y' or 'z'); index defaults to the central slice
+    - Returns: filename
+    """
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    ax_num = 'xyz'.index(axis)
+    if index is None:
+        index = dose_rate.shape[ax_num] // 2
+    plane = np.take(dose_rate, index, axis=ax_num)
+
+    # Voxel centres along the two in-plane axes (Cartesian RegularMesh)
+    in_plane = [i for i in range(3) if i != ax_num]
+    centers = []
+    for i in in_plane:
+        edges = np.linspace(mesh.lower_left[i], mesh.upper_right[i], mesh.dimension[i] + 1)
+        centers.append(0.5 * (edges[1:] + edges[:-1]))
+
+    positive = plane[plane > 0]
+    norm = None
+    if positive.size:
+        norm = matplotlib.colors.LogNorm(vmin=positive.min(), vmax=positive.max())
+
+    fig, ax = plt.subplots(figsize=(6, 5))
+    image = ax.pcolormesh(centers[0], centers[1], plane.T, shading='auto', cmap='inferno', norm=norm)
+    contours = ax.contour(centers[0], centers[1], plane.T, levels=sorted(levels), colors='cyan', linewidths=0.8)
+    ax.clabel(contours, fmt='%.1e Sv/h', fontsize=7)
+    fig.colorbar(image, ax=ax, label='Dose rate [Sv/h]')
+    ax.set_xlabel(f"{'xyz'[in_plane[0]]} [cm]")
+    ax.set_ylabel(f"{'xyz'[in_plane[1]]} [cm]")
+    ax.set_title(f'Isodose contours ({axis} slice {index})')
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    return filename
@@ -22,6 +22,7 @@ def build_spentfuelsphere_albox(box_side, box_width,  sphere_inner_radius, spher
     
     #spent_fuel
     mspentfuel = openmc.Material(1,'spent UO2')
+    mspentfuel.depletable = True  # the only material depletion burns
     mspentfuel.set_density('atom/b-cm',7.133315757E-02)
     #mspentfuel.temperature = T #Temperature can be assigned if we have an idea 
     mspentfuel.add_nuclide('O16',6.7187968E-01)
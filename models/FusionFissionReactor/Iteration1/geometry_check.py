@@ -0,0 +1,198 @@
+import openmc
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+BOUNDARY_TYPES = ('vacuum', 'reflective', 'periodic', 'white')
+
+
+def _contains(region, xyz):
+    # Vectorized point-in-region test: xyz is a tuple of (x, y, z) arrays
+    if isinstance(region, openmc.Halfspace):
+        value = region.surface.evaluate(xyz)
+        return value < 0.0 if region.side == '-' else value > 0.0
+    if isinstance(region, openmc.Intersection):
+        return np.logical_and.reduce([_contains(r, xyz) for r in region])
+    if isinstance(region, openmc.Union):
+        return np.logical_or.reduce([_contains(r, xyz) for r in region])
+    if isinstance(region, openmc.Complement):
+        return ~_contains(region.node, xyz)
+    raise TypeError(f"Unsupported region type {type(region).__name__}")
+
+
+def _halfspaces(region):
+    if isinstance(region, openmc.Halfspace):
+        yield region
+    elif isinstance(region, openmc.Complement):
+        yield from _halfspaces(region.node)
+    elif region is not None:
+        for r in region:
+            yield from _halfspaces(r)
+
+
+def _problem_interior(cells):
+    # Inside of each boundary surface = the only side the cells ever use.
+    # Surfaces used from both sides are ambiguous and are not used as a mask.
+    sides, surfaces = {}, {}
+    for cell in cells:
+        for hs in _halfspaces(cell.region):
+            if hs.surface.boundary_type in BOUNDARY_TYPES:
+                sides.setdefault(hs.surface.id, set()).add(hs.side)
+                surfaces[hs.surface.id] = hs.surface
+    return [(-surfaces[uid] if used == {'-'} else +surfaces[uid])
+            for uid, used in sides.items() if len(used) == 1]
+
+
+def classify_points(geometry, points):
+    """
+    Counts how many root-universe cells contain each point.
+
+    - points: (N, 3) array in cm
+    - Returns: (counts, inside) where counts == 0 is an undefined region,
+      counts > 1 an overlap, and inside marks points within the problem
+      boundary (vacuum/reflective surfaces); points outside are never tracked
+    """
+
+    cells = list(geometry.root_universe.cells.values())
+    xyz = (points[:, 0], points[:, 1], points[:, 2])
+    counts = np.zeros(len(points), dtype=int)
+    for cell in cells:
+        if cell.region is None:
+            counts += 1
+        else:
+            counts += _contains(cell.region, xyz)
+
+    inside = np.ones(len(points), dtype=bool)
+    for halfspace in _problem_interior(cells):
+        inside &= _contains(halfspace, xyz)
+    return counts, inside
+
+
+def locate_cells(geometry, points):
+    """
+    Finds the root-universe cell containing each point (first match).
+
+    - points: (N, 3) array in cm
+    - Returns: (cells, index) where index[i] points into the cells list,
+      or is -1 where no cell contains the point
+    """
+
+    cells = list(geometry.root_universe.cells.values())
+    xyz = (points[:, 0], points[:, 1], points[:, 2])
+    index = np.full(len(points), -1)
+    for i, cell in enumerate(cells):
+        hit = np.ones(len(points), dtype=bool) if cell.region is None else _contains(cell.region, xyz)
+        index[hit & (index < 0)] = i
+    return cells, index
+
+
+def _bounds(geometry, lower_left, upper_right):
+    if lower_left is None or upper_right is None:
+        lower_left, upper_right = geometry.bounding_box
+    lower_left, upper_right = np.asarray(lower_left, float), np.asarray(upper_right, float)
+    if not (np.all(np.isfinite(lower_left)) and np.all(np.isfinite(upper_right))):
+        raise ValueError("Geometry is unbounded; pass lower_left/upper_right explicitly")
+    return lower_left, upper_right
+
+
+def _bad_points(geometry, points):
+    counts, inside = classify_points(geometry, points)
+    return inside & (counts == 0), inside & (counts > 1)
+
+
+def check_points(geometry, n_points=1_000_000, lower_left=None, upper_right=None,
+                 workers=4, seed=1, max_report=10):
+    """
+    Samples points uniformly in the bounding box and reports undefined and
+    overlapping regions (with example coordinates).
+
+    - Sampling is split into chunks evaluated concurrently (numpy releases the GIL)
+    - Returns: dict with fractions of sampled volume and example coordinates
+    """
+
+    lower_left, upper_right = _bounds(geometry, lower_left, upper_right)
+    rng = np.random.default_rng(seed)
+    points = lower_left + rng.random((n_points, 3)) * (upper_right - lower_left)
+
+    chunks = np.array_split(points, max(1, workers) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda p: _bad_points(geometry, p), chunks))
+    undefined = np.concatenate([r[0] for r in results])
+    overlap = np.concatenate([r[1] for r in results])
+
+    return {
+        'undefined_fraction': float(undefined.mean()),
+        'overlap_fraction': float(overlap.mean()),
+        'undefined_points': points[undefined][:max_report].tolist(),
+        'overlap_points': points[overlap][:max_report].tolist(),
+    }
+
+
+def check_rays(geometry, source_points, n_rays=20_000, step=0.5, lower_left=None,
+               upper_right=None, seed=2, max_report=10):
+    """
+    Marches isotropic rays from source sites to the problem boundary and
+    estimates the fraction of histories that would be lost on first flight.
+
+    - source_points: (M, 3) array of birth sites (e.g. sampled from the source)
+    - step: march step in cm; features thinner than this can be missed
+    - Returns: dict with 'loss_rate' and example first-bad coordinates
+    """
+
+    lower_left, upper_right = _bounds(geometry, lower_left, upper_right)
+    rng = np.random.default_rng(seed)
+    source_points = np.atleast_2d(np.asarray(source_points, float))
+    starts = source_points[rng.integers(len(source_points), size=n_rays)]
+
+    mu = rng.uniform(-1.0, 1.0, n_rays)
+    phi = rng.uniform(0.0, 2.0 * np.pi, n_rays)
+    sin_theta = np.sqrt(1.0 - mu**2)
+    directions = np.column_stack([sin_theta * np.cos(phi), sin_theta * np.sin(phi), mu])
+
+    n_steps = int(np.ceil(np.linalg.norm(upper_right - lower_left) / step))
+    distances = np.arange(1, n_steps + 1) * step
+
+    lost = np.zeros(n_rays, dtype=bool)
+    first_bad = np.full((n_rays, 3), np.nan)
+    # Process rays in blocks to keep the (rays x steps x 3) array bounded
+    block = max(1, 2_000_000 // n_steps)
+    for s in range(0, n_rays, block):
+        pts = starts[s:s + block, None, :] + directions[s:s + block, None, :] * distances[None, :, None]
+        flat = pts.reshape(-1, 3)
+        counts, inside = classify_points(geometry, flat)
+        counts, inside = counts.reshape(pts.shape[:2]), inside.reshape(pts.shape[:2])
+        # Only the path before the ray first leaves the problem boundary counts
+        alive = np.cumprod(inside, axis=1).astype(bool)
+        bad = alive & (counts != 1)
+        hit = bad.any(axis=1)
+        lost[s:s + block] = hit
+        idx = np.argmax(bad, axis=1)
+        first_bad[s:s + block][hit] = pts[np.arange(len(pts)), idx][hit]
+
+    return {
+        'loss_rate': float(lost.mean()),
+        'lost_ray_points': first_bad[lost][:max_report].tolist(),
+    }
+
+
+def preflight(geometry, source_points, max_loss_rate=1.0e-5, n_points=1_000_000, n_rays=20_000, **kwargs):
+    """
+    Runs the point and ray checks and refuses to continue when the estimated
+    lost-particle rate is above max_loss_rate.
+
+    - Raises: RuntimeError with the offending coordinates
+    - Returns: combined report dict when the geometry passes
+    """
+
+    report = check_points(geometry, n_points=n_points, **kwargs)
+    report.update(check_rays(geometry, source_points, n_rays=n_rays,
+                             lower_left=kwargs.get('lower_left'), upper_right=kwargs.get('upper_right')))
+
+    print(f"Geometry check: undefined {report['undefined_fraction']:.2e}, "
+          f"overlap {report['overlap_fraction']:.2e} of sampled volume, "
+          f"estimated loss rate {report['loss_rate']:.2e}")
+    if report['loss_rate'] > max_loss_rate or report['overlap_fraction'] > 0.0:
+        raise RuntimeError(
+            f"Geometry failed pre-flight check (loss rate {report['loss_rate']:.2e} > {max_loss_rate:.0e} "
+            f"or overlaps present). Undefined at e.g. {report['undefined_points'][:3]}, "
+            f"overlaps at e.g. {report['overlap_points'][:3]}, lost rays at e.g. {report['lost_ray_points'][:3]}")
+    return report
@@ -0,0 +1,164 @@
+import openmc
+import openmc.lib
+import numpy as np
+import os
+import shutil
+import time
+
+from timing import Timeline
+
+
+class InMemoryDriver:
+    """
+    Keeps one openmc.lib session alive across many transport runs.
+
+    Cross sections and geometry are loaded once at init; between runs only
+    material densities, cell temperatures and tallies change in memory, so
+    sweeps and coupled iterations skip process start-up, XML parsing and the
+    cross-section load that every openmc.run() pays.
+
+    - with InMemoryDriver(model) as driver: ... (init/finalize)
+    - set_density/set_nuclide_densities/set_temperature modify the model in place
+    - add_tally() creates a tally without touching tallies.xml
+    - run() resets tallies and the batch counter and transports again
+    - set_source() is the exception: openmc.lib cannot change external
+      sources in memory, so it re-exports settings.xml and re-initialises
+    """
+
+    def __init__(self, model, directory='in_memory', name='in_memory'):
+        self.model = model
+        self.directory = directory
+        self.timeline = Timeline(name)
+        self._ran = False
+        self._cwd = None
+
+    def __enter__(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._cwd = os.getcwd()
+        os.chdir(self.directory)
+        self.model.export_to_xml()
+        self._init()
+        return self
+
+    def __exit__(self, *exc):
+        openmc.lib.finalize()
+        os.chdir(self._cwd)
+        return False
+
+    def _init(self):
+        self.timeline.begin("init")
+        openmc.lib.init(output=False)
+        self.timeline.end("init")
+        self._ran = False
+
+    def set_density(self, material_id, density, units='atom/b-cm'):
+        openmc.lib.materials[material_id].set_density(density, units)
+
+    def set_nuclide_densities(self, material_id, nuclides, densities):
+        # densities in atom/b-cm; nuclides must have been loaded at init
+        openmc.lib.materials[material_id].set_densities(list(nuclides), np.asarray(densities, dtype=float))
+
+    def set_temperature(self, cell_id, temperature):
+        openmc.lib.cells[cell_id].set_temperature(temperature)
+
+    def set_source(self, source):
+        self.model.settings.source = source
+        self.model.settings.export_to_xml()
+        openmc.lib.finalize()
+        self._init()
+
+    def add_tally(self, scores, material_ids=None):
+        """
+        Creates a tally in memory (optionally filtered by material). Returns its id.
+        """
+
+        tally = openmc.lib.Tally()
+        if material_ids is not None:
+            tally.filters = [openmc.lib.MaterialFilter([openmc.lib.materials[i] for i in material_ids])]
+        tally.scores = list(scores)
+        tally.active = True
+        return tally.id
+
+    def tally_mean(self, tally_id):
+        tally = openmc.lib.tallies[tally_id]
+        return np.asarray(tally.mean), np.asarray(tally.std_dev)
+
+    def run(self, step=None):
+        """
+        One transport solve with the current in-memory state. Returns wall seconds.
+        """
+
+        if self._ran:
+            openmc.lib.hard_reset()
+        start = time.perf_counter()
+        openmc.lib.run(output=False)
+        seconds = time.perf_counter() - start
+        self.timeline.add("in-memory run", seconds, step=step)
+        self._ran = True
+        return seconds
+
+
+def compare_overhead(model, n_iterations=5, directory='overhead'):
+    """
+    Runs the same model n_iterations times as subprocesses (openmc.run, the
+    current approach) and in one InMemoryDriver session, with a fixed seed so
+    both do identical transport work.
+
+    - Returns: dict with one-off init time, mean seconds per iteration for
+      each approach and the per-iteration overhead the driver removes
+    """
+
+    model.settings.seed = model.settings.seed or 1
+    sub_dir = os.path.join(directory, 'subprocess')
+    os.makedirs(sub_dir, exist_ok=True)
+    subprocess_times = []
+    for _ in range(n_iterations):
+        start = time.perf_counter()
+        model.run(cwd=sub_dir, output=False)
+        subprocess_times.append(time.perf_counter() - start)
+
+    with InMemoryDriver(model, os.path.join(directory, 'in_memory'), name='overhead') as driver:
+        memory_times = [driver.run(step=i) for i in range(n_iterations)]
+        init = driver.timeline.events[0]['seconds']
+    shutil.rmtree(sub_dir, ignore_errors=True)
+
+    report = {
+        'iterations': n_iterations,
+        'init_s': init,
+        'subprocess_per_iteration_s': float(np.mean(subprocess_times)),
+        'in_memory_per_iteration_s': float(np.mean(memory_times)),
+    }
+    report['overhead_per_iteration_s'] = report['subprocess_per_iteration_s'] - report['in_memory_per_iteration_s']
+    print(f"Subprocess: {report['subprocess_per_iteration_s']:.2f} s/iteration, "
+          f"in-memory: {report['in_memory_per_iteration_s']:.2f} s/iteration after a "
+          f"{init:.2f} s one-off init; overhead removed {report['overhead_per_iteration_s']:.2f} s/iteration")
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+    from fuel_blanket import build_spentfuelsphere_albox
+
+    sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'NeutronSource'))
+    from neutronsource import create_cylindrical_source
+
+    geometry, materials = build_spentfuelsphere_albox(20.0, 20.0, 50.0, 100.0)
+    aluminum, spent_fuel, sodium = materials
+    settings = openmc.Settings()
+    settings.run_mode = 'fixed source'
+    settings.particles = 10_000
+    settings.batches = 5
+    settings.source = create_cylindrical_source(5.0, 1.0, 2.3e6, 2.5e6)
+    model = openmc.Model(geometry, materials, settings)
+
+    compare_overhead(model)
+
+    # Sodium density sweep in one session: U238 absorption in the fuel
+    with InMemoryDriver(model) as driver:
+        tally_id = driver.add_tally(['absorption'], [spent_fuel.id])
+        for density in (0.80, 0.856, 0.90):
+            driver.set_density(sodium.id, density, 'g/cm3')
+            driver.run()
+            mean, std = driver.tally_mean(tally_id)
+            print(f"Na {density:.3f} g/cm3: fuel absorption {mean.ravel()[0]:.5e} +/- {std.ravel()[0]:.1e}")
+        driver.timeline.write()
@@ -0,0 +1,151 @@
+import openmc
+import numpy as np
+import argparse
+import glob
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_TALLIES = ['flux_tally', '3d_heating_tally', 'power_tally']
+
+
+def enable_monitoring(settings, interval=1):
+    """
+    Makes openmc write an intermediate statepoint every `interval` batches
+    (plain runs and each openmc.deplete transport step alike), so a running
+    job can be inspected without waiting for it to finish.
+    """
+
+    settings.statepoint = {'batches': list(range(interval, settings.batches + 1, interval))}
+    return settings
+
+
+def summarize_statepoint(path, tally_names=DEFAULT_TALLIES):
+    """
+    Returns running means and relative errors of the named tallies.
+
+    - Small tallies: every bin's mean and relative error
+    - Mesh tallies: total, relative error of the total, worst-bin relative
+      error and fraction of scoring bins already below 10% error
+    """
+
+    summary = {'statepoint': os.path.basename(path), 'tallies': {}}
+    with openmc.StatePoint(path, autolink=False) as sp:
+        summary['batch'] = int(sp.current_batch)
+        summary['n_batches'] = int(sp.n_batches)
+        if sp.run_mode == 'eigenvalue' and sp.current_batch > (sp.n_inactive or 0):
+            summary['keff'] = [float(sp.keff.nominal_value), float(sp.keff.std_dev)]
+        for name in tally_names:
+            try:
+                tally = sp.get_tally(name=name)
+            except LookupError:
+                continue
+            mean, std = tally.mean.ravel(), tally.std_dev.ravel()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rel = np.where(mean > 0, std / mean, np.nan)
+            if mean.size <= 16:
+                summary['tallies'][name] = {'mean': mean.tolist(), 'rel_err': np.nan_to_num(rel, nan=0.0).tolist()}
+            else:
+                total = float(mean.sum())
+                scoring = np.isfinite(rel)
+                summary['tallies'][name] = {
+                    'total': total,
+                    'total_rel_err': float(np.sqrt((std**2).sum()) / total) if total > 0 else None,
+                    'max_bin_rel_err': float(np.nanmax(rel)) if scoring.any() else None,
+                    'converged_fraction': float((rel[scoring] < 0.1).mean()) if scoring.any() else 0.0,
+                }
+    return summary
+
+
+class StatepointTailer(threading.Thread):
+    """
+    Background thread that watches a run directory for new or updated
+    statepoints and keeps the latest summary in `self.latest`.
+    """
+
+    def __init__(self, run_dir='.', tally_names=DEFAULT_TALLIES, poll_seconds=5.0, on_update=None):
+        super().__init__(daemon=True)
+        self.run_dir = run_dir
+        self.tally_names = tally_names
+        self.poll_seconds = poll_seconds
+        self.on_update = on_update
+        self.latest = {}
+        self._seen = {}
+        self._halt = threading.Event()
+
+    def stop(self):
+        self._halt.set()
+
+    def run(self):
+        while not self._halt.is_set():
+            for path in glob.glob(os.path.join(self.run_dir, 'statepoint.*.h5')):
+                mtime = os.path.getmtime(path)
+                if self._seen.get(path) == mtime:
+                    continue
+                try:
+                    summary = summarize_statepoint(path, self.tally_names)
+                except (OSError, KeyError):
+                    continue   # openmc is still writing it; retry on the next poll
+                self._seen[path] = mtime
+                summary['updated'] = time.strftime('%H:%M:%S')
+                self.latest = summary
+                if self.on_update:
+                    self.on_update(summary)
+            self._halt.wait(self.poll_seconds)
+
+
+def print_dashboard(summary):
+    print(f"[{summary['updated']}] {summary['statepoint']}  batch {summary['batch']}/{summary['n_batches']}")
+    if 'keff' in summary:
+        print(f"    k-eff = {summary['keff'][0]:.5f} +/- {summary['keff'][1]:.5f}")
+    for name, t in summary['tallies'].items():
+        if 'mean' in t:
+            cells = ", ".join(f"{m:.3e} ({r:.1%})" for m, r in zip(t['mean'], t['rel_err']))
+            print(f"    {name}: {cells}")
+        else:
+            print(f"    {name}: total {t['total']:.3e} ({(t['total_rel_err'] or 0):.1%}), "
+                  f"{t['converged_fraction']:.0%} of bins < 10% error")
+
+
+def serve(tailer, port=8765):
+    """
+    Serves the latest summary as JSON on http://localhost:<port>/
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(tailer.latest).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    print(f"Live tallies at http://127.0.0.1:{port}/")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Tail intermediate statepoints of a running job')
+    parser.add_argument('--dir', default='.', help='Run directory to watch (default: .)')
+    parser.add_argument('--tallies', nargs='+', default=DEFAULT_TALLIES, help='Tally names to report')
+    parser.add_argument('--poll', type=float, default=5.0, help='Polling interval in seconds')
+    parser.add_argument('--port', type=int, help='Also serve JSON on this local port')
+    args = parser.parse_args()
+
+    tailer = StatepointTailer(args.dir, args.tallies, args.poll, on_update=print_dashboard)
+    tailer.start()
+    try:
+        if args.port:
+            serve(tailer, args.port)
+        else:
+            while True:
+                time.sleep(1.0)
+    except KeyboardInterrupt:
+        tailer.stop()
@@ -0,0 +1,124 @@
+import argparse
+import csv
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+REACTOR_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reactor.py")
+
+
+def choose_layout(nodes, cores_per_node, sockets_per_node=2):
+    """
+    Picks an MPI ranks x OpenMP threads layout for coupled depletion.
+
+    - One rank per socket (NUMA domain) keeps each rank's cross sections local
+      while transport threads share them; threads = cores per socket
+    - Sized from the hardware only: transport dominates the run time. The
+      burnup solve splits depletable materials across ranks, so with fewer
+      materials (zones) than ranks some ranks sit idle during that short phase
+    - Returns: (total_ranks, threads_per_rank)
+    """
+
+    ranks_per_node = sockets_per_node
+    threads = max(1, cores_per_node // ranks_per_node)
+    return nodes * ranks_per_node, threads
+
+
+def mpi_command(script, ranks, threads, nodes=1, mpiexec="mpiexec", python=sys.executable, script_args=()):
+    """
+    Builds the mpiexec command line for a hybrid MPI x OpenMP run.
+
+    OMP_NUM_THREADS is exported to every rank; with Open MPI the ranks are
+    also spread evenly over the nodes and bound to `threads` cores each.
+    """
+
+    cmd = [mpiexec, "-n", str(ranks)]
+    if "Open MPI" in _mpiexec_version(mpiexec):
+        per_node = max(1, ranks // nodes)
+        cmd += ["--map-by", f"ppr:{per_node}:node:pe={threads}", "-x", "OMP_NUM_THREADS"]
+    else:
+        cmd += ["-env", "OMP_NUM_THREADS", str(threads)]
+    return cmd + [python, script, *script_args]
+
+
+def _mpiexec_version(mpiexec):
+    if shutil.which(mpiexec) is None:
+        raise RuntimeError(f"{mpiexec} not found; activate the openmc environment (mpi, mpi4py)")
+    out = subprocess.run([mpiexec, "--version"], capture_output=True, text=True)
+    return out.stdout + out.stderr
+
+
+def launch(ranks, threads, nodes=1, script=REACTOR_SCRIPT, env_overrides=None, mpiexec="mpiexec", cwd="."):
+    """
+    Runs the coupled depletion under MPI and returns the wall time in seconds.
+    """
+
+    env = dict(os.environ, OMP_NUM_THREADS=str(threads))
+    env.update({k: str(v) for k, v in (env_overrides or {}).items()})
+    cmd = mpi_command(script, ranks, threads, nodes=nodes, mpiexec=mpiexec)
+    print("Launching:", " ".join(cmd))
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, cwd=cwd, check=True)
+    return time.perf_counter() - start
+
+
+def scaling_study(core_counts, cores_per_node, sockets_per_node=2, mode="strong", base_particles=10_000,
+                  batches=3, steps=2, zones=1, output="scaling.csv", **launch_kwargs):
+    """
+    Measures strong or weak scaling of the depletion model.
+
+    - strong: fixed particles per batch for every core count
+    - weak: particles per batch grow with the core count
+    - A reduced number of depletion steps keeps each point short
+    - Returns: list of rows (also written to `output` as CSV)
+    """
+
+    rows = []
+    base_cores = core_counts[0]
+    for cores in core_counts:
+        nodes = max(1, cores // cores_per_node)
+        ranks, threads = choose_layout(nodes, min(cores, cores_per_node), sockets_per_node)
+        particles = base_particles if mode == "strong" else base_particles * cores // base_cores
+        wall = launch(ranks, threads, nodes=nodes, env_overrides={
+            "REACTOR_PARTICLES": particles, "REACTOR_BATCHES": batches, "REACTOR_STEPS": steps,
+            "REACTOR_ZONES": zones}, **launch_kwargs)
+        rows.append({"mode": mode, "cores": cores, "nodes": nodes, "ranks": ranks, "threads": threads,
+                     "particles_per_batch": particles, "wall_s": wall})
+
+    # Strong: speedup = T1/Tn, efficiency = speedup/(n/n1). Weak: efficiency = T1/Tn.
+    t_base = rows[0]["wall_s"]
+    for row in rows:
+        ratio = t_base / row["wall_s"]
+        row["speedup"] = ratio if mode == "strong" else ratio * row["cores"] / base_cores
+        row["efficiency"] = ratio / (row["cores"] / base_cores) if mode == "strong" else ratio
+
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    for row in rows:
+        print(f"{row['cores']:5d} cores ({row['ranks']} ranks x {row['threads']} threads): "
+              f"{row['wall_s']:.1f} s, speedup {row['speedup']:.2f}, efficiency {row['efficiency']:.0%}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run reactor.py depletion under MPI")
+    parser.add_argument("--nodes", type=int, default=1, help="Number of nodes in the allocation")
+    parser.add_argument("--cores-per-node", type=int, default=os.cpu_count(), help="Cores per node")
+    parser.add_argument("--sockets-per-node", type=int, default=2, help="Sockets (NUMA domains) per node")
+    parser.add_argument("--scaling", choices=["strong", "weak"], help="Run a scaling study instead of one run")
+    parser.add_argument("--core-counts", type=int, nargs="+", help="Core counts for the scaling study")
+    parser.add_argument("--zones", type=int, default=1, help="Radial depletion zones (REACTOR_ZONES)")
+    args = parser.parse_args()
+
+    if args.scaling:
+        counts = args.core_counts or [args.cores_per_node * n for n in (1, 2, 4) if n <= args.nodes]
+        scaling_study(counts, args.cores_per_node, args.sockets_per_node, mode=args.scaling,
+                      zones=args.zones, output=f"scaling_{args.scaling}.csv")
+    else:
+        ranks, threads = choose_layout(args.nodes, args.cores_per_node, args.sockets_per_node)
+        wall = launch(ranks, threads, nodes=args.nodes, env_overrides={"REACTOR_ZONES": args.zones})
+        print(f"Depletion finished in {wall:.1f} s on {ranks} ranks x {threads} threads")
@@ -0,0 +1,108 @@
+import openmc
+import numpy as np
+import h5py
+import glob
+import os
+import re
+
+EV_TO_JOULES = 1.602176634e-19
+
+# Scores that are energies (eV per source particle) and become W/cm^3
+ENERGY_SCORES = ('heating', 'heating-local', 'kappa-fission', 'fission-q-prompt', 'fission-q-recoverable')
+
+
+def read_source_rates(path="depletion_results.h5"):
+    """
+    Returns the source rate [n/s] used for each depletion step (first stage).
+    Also reads the compact store, which keeps one rate per step.
+    """
+
+    with h5py.File(path, "r") as f:
+        if "source_rate" not in f:
+            raise RuntimeError(f"No 'source_rate' dataset found in {path}")
+        rates = np.array(f["source_rate"][()])
+        return rates[:, 0] if rates.ndim == 2 else rates
+
+
+def simulation_statepoints(pattern="openmc_simulation_n*.h5"):
+    """
+    Returns the per-step statepoints written by openmc.deplete, in step order.
+    """
+
+    return sorted(glob.glob(pattern), key=simulation_step)
+
+
+def simulation_step(path):
+    """
+    Depletion step index of an openmc_simulation_n<i>.h5 statepoint.
+    openmc.deplete writes one for every step, but decay-only and cached-rate
+    steps hold the tallies of the previous transport solve (see
+    schedule.transported_steps).
+    """
+
+    return int(re.findall(r"(\d+)", os.path.basename(path))[-1])
+
+
+def material_volumes(statepoint, overrides=None):
+    """
+    Returns {material id: volume [cm^3]} taken from the model summary that
+    openmc stored alongside the run. `overrides` (id -> volume) wins, e.g. the
+    depletion results volumes or volumes.compute_volumes() output.
+    """
+
+    volumes = {}
+    if statepoint.summary is not None:
+        for mat in statepoint.summary.materials:
+            if mat.volume is not None:
+                volumes[mat.id] = float(mat.volume)
+    if overrides:
+        volumes.update({int(k): float(v) for k, v in overrides.items()})
+    return volumes
+
+
+def _unit_factors(scores):
+    # flux -> n/cm^2-s, reaction rates -> 1/cm^3-s, energy scores -> W/cm^3
+    return np.array([EV_TO_JOULES if s in ENERGY_SCORES else 1.0 for s in scores])
+
+
+def normalize_run(statepoints, source_rates, tally_name='flux_tally', volumes=None):
+    """
+    Converts a MaterialFilter-only tally to physical units for every step of a run.
+
+    - statepoints: list of statepoint paths, one per depletion step
+    - source_rates: source rate [n/s] for each statepoint
+    - volumes: optional {material id: volume} overriding the model summary
+    - Returns: dict with 'materials' (bin ids), 'volumes', 'scores', and
+      'mean'/'std_dev' arrays shaped (n_steps, n_materials, n_scores) in
+      physical units
+    """
+
+    n = min(len(statepoints), len(source_rates))
+    statepoints = list(statepoints)[:n]
+    source_rates = np.asarray(source_rates, dtype=float)[:n]
+
+    means, stds = [], []
+    mat_ids = scores = vol = None
+    for path in statepoints:
+        with openmc.StatePoint(path) as sp:
+            tally = sp.get_tally(name=tally_name)
+            if mat_ids is None:
+                mat_ids = [int(m) for m in tally.find_filter(openmc.MaterialFilter).bins]
+                scores = list(tally.scores)
+                known = material_volumes(sp, volumes)
+                missing = [m for m in mat_ids if m not in known]
+                if missing:
+                    raise RuntimeError(f"No volume for material(s) {missing}; run volumes.compute_volumes first")
+                vol = np.array([known[m] for m in mat_ids])
+            # Sum over nuclides; shape (n_materials, n_scores)
+            means.append(tally.mean.reshape(len(mat_ids), -1, len(scores)).sum(axis=1))
+            stds.append(np.sqrt((tally.std_dev.reshape(len(mat_ids), -1, len(scores))**2).sum(axis=1)))
+
+    factor = (source_rates[:, None, None] / vol[None, :, None]) * _unit_factors(scores)[None, None, :]
+    return {
+        'materials': mat_ids,
+        'volumes': vol,
+        'scores': scores,
+        'mean': np.stack(means) * factor,
+        'std_dev': np.stack(stds) * factor,
+    }
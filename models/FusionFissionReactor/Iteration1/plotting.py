@@ -0,0 +1,192 @@
+import openmc
+import numpy as np
+import json
+import os
+import glob
+from concurrent.futures import ThreadPoolExecutor
+
+from volumes import geometry_hash
+from geometry_check import classify_points
+
+PLOT_CACHE_DIR = "plot_cache"
+
+# Sentinel colors: anything painted with these is a geometry problem
+BACKGROUND_COLOR = (255, 0, 255)   # no cell defined at this point (or outside the boundary)
+OVERLAP_COLOR = (255, 255, 0)      # point is inside more than one cell
+PALETTE = [(31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40), (148, 103, 189),
+           (140, 86, 75), (227, 119, 194), (127, 127, 127), (23, 190, 207), (188, 189, 34)]
+SLICES = (('xy', (0, 1)), ('xz', (0, 2)), ('yz', (1, 2)))
+
+
+def _plot_frame(geometry):
+    # (origin, width) of the box the plots cover
+    lower_left, upper_right = geometry.bounding_box
+    lower_left = np.where(np.isfinite(lower_left), lower_left, -100.0)
+    upper_right = np.where(np.isfinite(upper_right), upper_right, 100.0)
+    return 0.5 * (lower_left + upper_right), upper_right - lower_left
+
+
+def build_plots(geometry, materials, pixels=800, voxel_pixels=100):
+    """
+    Builds xy/xz/yz slice plots and a low-resolution voxel plot that cover
+    the geometry's bounding box.
+
+    - Slices are colored by material with overlap checking enabled
+    - Returns: openmc.Plots
+    """
+
+    origin, width = _plot_frame(geometry)
+    origin = tuple(origin)
+    colors = {mat: PALETTE[i % len(PALETTE)] for i, mat in enumerate(materials)}
+
+    plots = []
+    for basis, (i, j) in SLICES:
+        plot = openmc.Plot(name=f'slice_{basis}')
+        plot.filename = f'slice_{basis}'
+        plot.basis = basis
+        plot.origin = origin
+        plot.width = (width[i], width[j])
+        plot.pixels = (pixels, pixels)
+        plot.color_by = 'material'
+        plot.colors = colors
+        plot.background = BACKGROUND_COLOR
+        plot.show_overlaps = True
+        plot.overlap_color = OVERLAP_COLOR
+        plots.append(plot)
+
+    voxel = openmc.Plot(name='voxel')
+    voxel.filename = 'voxel'
+    voxel.type = 'voxel'
+    voxel.origin = origin
+    voxel.width = tuple(width)
+    voxel.pixels = (voxel_pixels, voxel_pixels, voxel_pixels)
+    voxel.color_by = 'material'
+    plots.append(voxel)
+
+    return openmc.Plots(plots)
+
+
+def _is_color(image, color):
+    rgb = np.asarray(image)[..., :3]
+    if rgb.dtype != np.uint8:
+        rgb = np.rint(rgb * 255).astype(np.uint8)
+    return np.all(rgb == np.array(color, dtype=np.uint8), axis=-1)
+
+
+def _inside_boundary(geometry, basis, shape):
+    # Pixel centres of a slice image (row 0 at the top) -> inside the problem boundary
+    origin, width = _plot_frame(geometry)
+    i, j = dict(SLICES)[basis]
+    rows, cols = shape
+    h = origin[i] - width[i] / 2 + (np.arange(cols) + 0.5) * width[i] / cols
+    v = origin[j] + width[j] / 2 - (np.arange(rows) + 0.5) * width[j] / rows
+    hh, vv = np.meshgrid(h, v)
+    points = np.tile(origin, (hh.size, 1))
+    points[:, i], points[:, j] = hh.ravel(), vv.ravel()
+    return classify_points(geometry, points)[1].reshape(shape)
+
+
+def geometry_qa(plot_dir, geometry):
+    """
+    Counts overlap and undefined pixels in every slice image.
+
+    Background pixels outside the problem boundary (vacuum/reflective
+    surfaces, see geometry_check) are void and are only counted as
+    outside_pixels; background inside it is an undefined region where
+    particles get lost.
+
+    - Returns: {slice name: {'overlap_pixels': n, 'undefined_pixels': n, 'outside_pixels': n}}
+    """
+
+    import matplotlib.image
+
+    report = {}
+    for png in sorted(glob.glob(os.path.join(plot_dir, 'slice_*.png'))):
+        image = matplotlib.image.imread(png)
+        name = os.path.splitext(os.path.basename(png))[0]
+        background = _is_color(image, BACKGROUND_COLOR)
+        inside = _inside_boundary(geometry, name[len('slice_'):], background.shape)
+        report[name] = {
+            'overlap_pixels': int(_is_color(image, OVERLAP_COLOR).sum()),
+            'undefined_pixels': int((background & inside).sum()),
+            'outside_pixels': int((background & ~inside).sum()),
+        }
+    return report
+
+
+def plot_case(name, geometry, materials, cache_dir=PLOT_CACHE_DIR, pixels=800, voxel_pixels=100):
+    """
+    Exports one model and prepares its plot directory, reusing cached images
+    when a model with the same geometry hash was already plotted.
+
+    - Returns: (plot_dir, needs_plotting)
+    """
+
+    key = geometry_hash(geometry, materials)
+    plot_dir = os.path.join(cache_dir, key)
+    qa_path = os.path.join(plot_dir, 'qa.json')
+    if os.path.exists(qa_path):
+        with open(qa_path) as f:
+            # Older reports counted void outside the boundary as undefined
+            if all('outside_pixels' in r for r in json.load(f).values()):
+                print(f"{name}: using cached plots {plot_dir}")
+                return plot_dir, False
+
+    os.makedirs(plot_dir, exist_ok=True)
+    geometry.export_to_xml(os.path.join(plot_dir, 'geometry.xml'))
+    materials.export_to_xml(os.path.join(plot_dir, 'materials.xml'))
+    build_plots(geometry, materials, pixels, voxel_pixels).export_to_xml(os.path.join(plot_dir, 'plots.xml'))
+    return plot_dir, True
+
+
+def _render(plot_dir, geometry):
+    openmc.plot_geometry(output=False, cwd=plot_dir)
+    report = geometry_qa(plot_dir, geometry)
+    with open(os.path.join(plot_dir, 'qa.json'), 'w') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def plot_sweep(cases, workers=None, cache_dir=PLOT_CACHE_DIR, pixels=800, voxel_pixels=100):
+    """
+    Renders slices + voxel plots for every model of a sweep in parallel.
+
+    - cases: iterable of (name, geometry, materials)
+    - workers: number of concurrent openmc plot processes (default: CPU count)
+    - Returns: {name: {'dir': plot_dir, 'qa': report, 'flagged': bool}}
+    """
+
+    cases = list(cases)
+    geometries = {name: geom for name, geom, _ in cases}
+    prepared = {name: plot_case(name, geom, mats, cache_dir, pixels, voxel_pixels)
+                for name, geom, mats in cases}
+
+    # openmc plots run as separate processes, so threads are enough to overlap them
+    todo = {name: d for name, (d, needed) in prepared.items() if needed}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        rendered = dict(zip(todo, pool.map(_render, todo.values(), [geometries[n] for n in todo])))
+
+    summary = {}
+    for name, (plot_dir, _) in prepared.items():
+        if name in rendered:
+            report = rendered[name]
+        else:
+            with open(os.path.join(plot_dir, 'qa.json')) as f:
+                report = json.load(f)
+        flagged = any(r['overlap_pixels'] > 0 or r['undefined_pixels'] > 0 for r in report.values())
+        summary[name] = {'dir': plot_dir, 'qa': report, 'flagged': flagged}
+        status = "OVERLAPS/UNDEFINED REGIONS FOUND" if flagged else "ok"
+        print(f"{name}: {status} -> {plot_dir}")
+    return summary
+
+
+if __name__ == "__main__":
+    from fuel_blanket import build_spentfuelsphere_albox
+
+    # Example sweep over the spent-fuel shell inner radius
+    cases = []
+    for inner in (30.0, 40.0, 50.0, 60.0):
+        geometry, materials = build_spentfuelsphere_albox(
+            box_side=20.0, box_width=20.0, sphere_inner_radius=inner, sphere_outer_radius=100.0)
+        cases.append((f"spentfuel_rin{inner:g}", geometry, materials))
+    plot_sweep(cases)
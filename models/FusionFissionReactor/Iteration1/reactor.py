@@ -4,9 +4,23 @@ import openmc
 import openmc.deplete
 import sys
 import os
+import time
+import numpy as np
 
 from blanket import build_u238_sphere
 from fuel_blanket import build_spentfuelsphere_albox
+from dose import build_dose_tally
+from power import build_power_tally
+from curved_mesh import aligned_mesh_tally
+from volumes import compute_volumes, apply_volumes
+from geometry_check import preflight
+from timing import Timeline
+from monitor import enable_monitoring
+from schedule import Schedule, CachedRateOperator, SCHEDULE_FILE, save_transport_flags
+from zoning import zone_depletable_shells, save_zones
+from normalization import simulation_statepoints
+from catalog import RunCatalog
+from compact_results import compact_results, COMPACT_FILE
 # --- This block "makes it public" ---
 # Get the path to the current file's folder (e.g., .../FusionFissionReactor)
 current_file_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,8 +46,26 @@ E_min, E_max = 2.3e6, 2.5e6
 u238_sphere_radius = 25.5
 
 # --- Transport Settings ---
-particles_per_batch = 10_000
-num_batches = 3
+# (mpi_launcher.py overrides these through the environment for scaling runs)
+particles_per_batch = int(os.environ.get("REACTOR_PARTICLES", 10_000))
+num_batches = int(os.environ.get("REACTOR_BATCHES", 3))
+MONITOR_INTERVAL = 1  # write a statepoint every N batches; tail with `python monitor.py`
+
+# --- Geometry Pre-flight Check ---
+# Opt-in (REACTOR_PREFLIGHT=1): 1M points + 20k rays on rank 0 before depletion;
+# worth it after geometry changes, not on every production run
+RUN_PREFLIGHT = os.environ.get("REACTOR_PREFLIGHT", "0") == "1"
+MAX_LOSS_RATE = 1.0e-5  # refuse to run if more histories than this would be lost
+
+# --- Volume Calculation ---
+# 'cached' (default): stochastic volumes only if volume_cache/ already has them,
+# 'compute': run the volume calculation on a cache miss, 'off': analytic volumes
+VOLUME_MODE = os.environ.get("REACTOR_VOLUMES", "cached")
+VOLUME_SAMPLES = 10_000_000
+
+# --- Radial Zoning ---
+# Split the spent-fuel shell into concentric depletion zones (1 = no zoning)
+NUM_ZONES = int(os.environ.get("REACTOR_ZONES", 1))
 
 # --- Depletion Parameters ---
 SOURCE_STRENGTH_PER_SEC = 1.0e15  # neutrons / sec
@@ -46,17 +78,32 @@ time_years = 5.0
 time_seconds = time_years * days_per_year * hours_per_day * seconds_per_hour
 
 timesteps_in_seconds = [time_seconds]# Define how many steps you want (e.g., 12 steps to see monthly progress)
-num_steps = 12
+num_steps = int(os.environ.get("REACTOR_STEPS", 12))
 
 total_time_seconds = time_seconds # 1 year
 step_size = total_time_seconds / num_steps
 
 timesteps_in_seconds = [step_size] * num_steps
 
+# Operating history as a source-rate timeline (see schedule.py). The default
+# is the constant source; a pulsed history looks like
+#   for year in range(int(time_years)):
+#       schedule.pulses(n=3_100_000, on=1.0, off=9.0, rate=SOURCE_STRENGTH_PER_SEC, max_step=step_size)
+#       schedule.outage(30 * 24 * 3600.0)
+# Outages become decay-only steps; repeated pulses reuse reaction rates.
+schedule = Schedule()
+schedule.constant(total_time_seconds, SOURCE_STRENGTH_PER_SEC, n_steps=num_steps)
+
 # Path to the chain file you downloaded
 CHAIN_FILE = "models/FusionFissionReactor/Iteration1/chain_endfb80_pwr.xml"# ---------------------------------------------------------------
 
+# Phase timings for this run end up in timeline_<RUN_NAME>.json/.csv
+RUN_NAME = os.environ.get("REACTOR_RUN_NAME", "reactor")
+timeline = Timeline(RUN_NAME)
+run_started = time.time()
+
 print("Building model...")
+timeline.begin("model build")
 # 1. Create the Neutron Source
 my_source = create_cylindrical_source(
     height=cyl_H,
@@ -79,8 +126,58 @@ my_source = create_cylindrical_source(
     sphere_outer_radius=100.0
 )
 
-my_materials.export_to_xml()
-my_geometry.export_to_xml()
+timeline.end("model build")
+
+# Optionally check for undefined/overlapping regions before spending hours on
+# depletion (REACTOR_PREFLIGHT=1; plotting.py sweeps cover routine QA).
+# Rays are started from birth sites sampled uniformly in the z-pinch cylinder.
+rng = np.random.default_rng(12345)
+r_birth = cyl_R * np.sqrt(rng.random(1000))
+phi_birth = rng.uniform(0.0, 2.0 * np.pi, 1000)
+birth_sites = np.column_stack([r_birth * np.cos(phi_birth), r_birth * np.sin(phi_birth),
+                               rng.uniform(-cyl_H / 2.0, cyl_H / 2.0, 1000)])
+# Under MPI (see mpi_launcher.py) only rank 0 checks the geometry, runs the
+# volume calculation and writes XML; the other ranks receive the volumes.
+comm = openmc.deplete.comm
+volumes = None
+if comm.rank == 0:
+    # A failure here is broadcast in place of the volumes so that every rank
+    # raises it, rather than the others waiting in bcast forever
+    try:
+        if RUN_PREFLIGHT:
+            timeline.begin("geometry check")
+            preflight(my_geometry, birth_sites, max_loss_rate=MAX_LOSS_RATE)
+            timeline.end("geometry check")
+
+        # Replace the analytic volumes with stochastic ones for every cell/material
+        # (gives the Na coolant region between the Al box and the sphere a volume too)
+        if VOLUME_MODE != 'off':
+            timeline.begin("volume calculation")
+            volumes = compute_volumes(my_geometry, my_materials, samples=VOLUME_SAMPLES,
+                                      cached_only=VOLUME_MODE == 'cached')
+            timeline.end("volume calculation")
+            if volumes is None:
+                print("No cached volumes for this model; using analytic volumes "
+                      "(REACTOR_VOLUMES=compute runs the volume calculation)")
+    except Exception as e:
+        volumes = e
+volumes = comm.bcast(volumes)
+if isinstance(volumes, Exception):
+    raise volumes
+if volumes is not None:
+    apply_volumes(my_geometry, my_materials, volumes)
+
+# Zones get exact shell volumes (after the stochastic volumes are applied)
+if NUM_ZONES > 1:
+    zoned = zone_depletable_shells(my_geometry, my_materials, NUM_ZONES)
+    if comm.rank == 0:
+        save_zones(zoned)
+
+if comm.rank == 0:
+    timeline.begin("xml export")
+    my_materials.export_to_xml()
+    my_geometry.export_to_xml()
+    timeline.end("xml export")
 
 # 3. Define Settings for the transport "snapshot"
 settings = openmc.Settings()
@@ -88,7 +185,8 @@ settings.run_mode  = 'fixed source'
 settings.particles = particles_per_batch
 settings.batches   = num_batches
 settings.source    = my_source
-settings.max_lost_particles = 1000000
+# No lost-particle allowance: the geometry is checked before the long run instead
+enable_monitoring(settings, MONITOR_INTERVAL)
 
 # 4. Define a 3D Mesh Tally for Heating
 print("Creating 3D heating tally...")
@@ -113,9 +211,23 @@ flux_tally = openmc.Tally(name='flux_tally')
 # FIX: Use MaterialFilter instead of CellFilter.
 # This will give you the average flux inside your U238 Materials.
 flux_tally.filters = [openmc.MaterialFilter(my_materials)]
-flux_tally.scores = ['flux']
+flux_tally.scores = ['flux', 'fission', '(n,gamma)']
+
+# C. Dose-rate map over the whole 100 cm spent-fuel sphere (ICRP-116 coefficients)
+dose_mesh = openmc.RegularMesh()
+dose_mesh.dimension = (50, 50, 50)
+dose_mesh.lower_left = [-100.0, -100.0, -100.0]
+dose_mesh.upper_right = [100.0, 100.0, 100.0]
+dose_tally = build_dose_tally(dose_mesh)
 
-tallies = openmc.Tallies([heating_tally, flux_tally])
+# D. Energy deposition per material (power accounting for every step)
+power_tally = build_power_tally(my_materials)
+
+# E. Radial flux/heating profile on a spherical mesh aligned with the shells
+# (same radial resolution as the Cartesian mesh with a tiny fraction of the bins)
+radial_tally = aligned_mesh_tally(my_geometry, scores=['flux', 'heating'], bins_per_shell=20)
+
+tallies = openmc.Tallies([heating_tally, flux_tally, dose_tally, power_tally, radial_tally])
 
 # 5. Create the main OpenMC model
 print("Bundling model...")
@@ -127,6 +239,7 @@ model = openmc.Model(
 )
 
 print("Setting up depletion operator...")
+timeline.begin("operator setup")
 operator = openmc.deplete.CoupledOperator(
     model=model,
     chain_file=CHAIN_FILE,
@@ -135,16 +248,52 @@ operator = openmc.deplete.CoupledOperator(
     normalization_mode="source-rate"
 )
 
-source_rates_list = [SOURCE_STRENGTH_PER_SEC] * len(timesteps_in_seconds)
+timeline.end("operator setup")
+
+timesteps_in_seconds, source_rates_list, transport_steps = schedule.compile()
+print(f"Schedule: {len(timesteps_in_seconds)} steps, {sum(transport_steps)} transport solves, "
+      f"{source_rates_list.count(0.0)} decay-only")
+operator = CachedRateOperator(operator, source_rates_list, transport_steps)
+if comm.rank == 0:
+    # results.py needs these to tell fresh statepoints from stale ones
+    save_transport_flags(transport_steps)
 
 integrator = openmc.deplete.PredictorIntegrator(
     operator=operator,
     timesteps=timesteps_in_seconds,
-    source_rates=source_rates_list,  # Now both are length 12
+    source_rates=source_rates_list,
     timestep_units='s'
 )
 
 print(f"Running depletion for {time_seconds} seconds...")
+if comm.rank == 0 and os.path.exists(COMPACT_FILE):
+    os.remove(COMPACT_FILE)  # compact results of a previous run
+timeline.begin("depletion total")
 integrator.integrate()
+timeline.end("depletion total")
+
+if comm.rank == 0:
+    # Full precision for the nuclides/reactions we analyse, float32+gzip for the rest
+    n_compacted = compact_results("depletion_results.h5", COMPACT_FILE)
+    print(f"Compact results: {n_compacted} steps appended to {COMPACT_FILE} "
+          f"({os.path.getsize(COMPACT_FILE) / 1e6:.2f} MB vs {os.path.getsize('depletion_results.h5') / 1e6:.2f} MB)")
+
+    # Per-step breakdown: cross-section load, inactive/active particles/sec,
+    # tally reduction (from each step statepoint) and burnup matrix solve time
+    timeline.add_depletion("depletion_results.h5")
+    json_path, csv_path = timeline.write()
+    print(f"Timing timeline written to {json_path} and {csv_path}")
+
+    # Index this run (inputs, outputs, tally summaries, timings) for results.py and sweeps
+    with RunCatalog() as catalog:
+        run_id = catalog.record(
+            RUN_NAME, kind='depletion', started=run_started, timings=timeline.events,
+            parameters={'particles': particles_per_batch, 'batches': num_batches, 'steps': num_steps,
+                        'source_rate': SOURCE_STRENGTH_PER_SEC, 'time_s': total_time_seconds,
+                        'zones': NUM_ZONES, 'cyl_H': cyl_H, 'cyl_R': cyl_R, 'E_min': E_min, 'E_max': E_max},
+            outputs={'depletion_results': 'depletion_results.h5', 'compact_results': COMPACT_FILE,
+                     'statepoint': simulation_statepoints(), 'schedule': SCHEDULE_FILE,
+                     'timeline': [json_path, csv_path]})
+    print(f"Run recorded in {catalog.path} as run {run_id}")
 
 print("Depletion simulation complete. Results are in 'depletion_results.h5'")
\ No newline at end of file
@@ -5,67 +5,128 @@ import math
 import os
 import pandas as pd
 
-# Constants
-U238_MAT_NAME = "1"  # Named 1 in blanket.py
-MEV_PER_FISSION = 200.0 # On Avg - Checked for U-238
-MEV_TO_JOULES = 1.60218e-13
-
-print("Reading depletion results...")
-results = openmc.deplete.Results("depletion_results.h5")
+from dose import dose_rate_map, plot_isodose
+from normalization import EV_TO_JOULES, read_source_rates, simulation_statepoints, simulation_step, normalize_run
+from power import power_by_step
+from zoning import ZONES_FILE, load_zones, radial_inventory
+from catalog import CATALOG_DB, RunCatalog
+from uncertainty import quadrature, weighted_std, cumulative_std, relative, particles_needed, fmt
+from compact_results import COMPACT_FILE, CompactResults
+from schedule import SCHEDULE_FILE, load_transport_flags, transported_steps, fill_cached
+from sparse_mesh import sparse_from_statepoint, save_sparse
+from curved_mesh import radial_profile
+
+# Newest reactor.py run from the run catalog; fixed file names if there is none
+DEPLETION_FILE = "depletion_results.h5"
+step_statepoints = None
+compact_file = COMPACT_FILE
+schedule_file = SCHEDULE_FILE
+if os.path.exists(CATALOG_DB):
+    with RunCatalog() as catalog:
+        runs = catalog.find_runs(kind='depletion')
+        if runs:
+            print(f"Using run {runs[0]['id']} ({runs[0]['name']}) from {CATALOG_DB}")
+            DEPLETION_FILE = catalog.outputs(runs[0]['id'], 'depletion_results')[0]
+            compact_file = (catalog.outputs(runs[0]['id'], 'compact_results') or [None])[0]
+            schedule_file = (catalog.outputs(runs[0]['id'], 'schedule') or [None])[0]
+            step_statepoints = catalog.outputs(runs[0]['id'], 'statepoint')
+
+# The compact store (compact_results.py) holds every series read below at a
+# fraction of the size; the full openmc.deplete file is the fallback
+if compact_file and os.path.exists(compact_file):
+    RESULTS_FILE = compact_file
+    results = CompactResults(compact_file)
+    volumes = results.volume
+else:
+    RESULTS_FILE = DEPLETION_FILE
+    results = openmc.deplete.Results(DEPLETION_FILE)
+    volumes = results[0].volume
+print(f"Reading depletion results from {RESULTS_FILE}...")
 times_s = np.array(results.get_times(time_units='s'))  # 's'|'min'|'h'|'d'
 assert len(times_s) >= 2, "Depletion Model does not have enough data"
 
-# Get fission rates
-# Could also use '(n,gamma)' for capture, '(n,p)' for proton emission
-# Tuple (time array, corresponding reaction rate array)
-_, u238_fiss_rate = results.get_reaction_rate(U238_MAT_NAME, 'U238', 'fission')
-_, u235_fiss_rate = results.get_reaction_rate(U238_MAT_NAME, 'U235', 'fission')
-_, cm244_fiss_rate = results.get_reaction_rate(U238_MAT_NAME, 'Cm244', 'fission')
+# The results hold only the depletable materials: the spent-fuel shell, or one
+# material per zone with radial zoning (REACTOR_ZONES in reactor.py)
+DEPLETED_MATS = sorted(volumes, key=int)
+zones = next(iter(load_zones().values()), None) if os.path.exists(ZONES_FILE) else None
 
-try:
-    _, pu239_fiss_rate = results.get_reaction_rate(U238_MAT_NAME, 'Pu239', 'fission')
-    _, pu240_fiss_rate = results.get_reaction_rate(U238_MAT_NAME, 'Pu240', 'fission')
-    _, pu241_fiss_rate = results.get_reaction_rate(U238_MAT_NAME, 'Pu241', 'fission')
 
-except KeyError:
-    pu239_fiss_rate = np.zeros_like(u238_fiss_rate)
+def sum_over_zones(getter, *args, **kwargs):
+    # results.get_mass/get_decay_heat summed over every zone of the shell
+    total = 0.0
+    for mat in DEPLETED_MATS:
+        t, values = getter(mat, *args, **kwargs)
+        total = total + np.asarray(values)
+    return t, total
 
 idx_start = 0
 idx_end = -1
 
-fiss_rate = u238_fiss_rate + pu239_fiss_rate + u235_fiss_rate + cm244_fiss_rate + pu240_fiss_rate + pu241_fiss_rate
-#fiss_rate = u238_fiss_rate + pu239_fiss_rate 
+# Power and fission rates straight from the energy-deposition tally of each step
+# (all materials, every fissioning nuclide - no 200 MeV/fission assumption)
+source_rates = read_source_rates(RESULTS_FILE)
+step_statepoints = step_statepoints or simulation_statepoints()
+# openmc.deplete writes a statepoint for every step, but decay-only and
+# cached-rate steps of a pulsed schedule only repeat the last transport
+# tallies: use just the fresh ones. Decay-only steps stay at zero, cached
+# steps are filled in by fill_cached() below
+transport_flags = load_transport_flags(schedule_file) if schedule_file and os.path.exists(schedule_file) else None
+transported = transported_steps(source_rates, transport_flags)
+step_statepoints = [p for p in step_statepoints if transported[simulation_step(p)]]
+if not step_statepoints:
+    # Every power, flux and dose series below is read from these statepoints
+    raise SystemExit("No statepoint from a transported depletion step was found "
+                     "(openmc_simulation_n<i>.h5); run reactor.py in this directory "
+                     "or record its statepoints in the run catalog")
+sim_steps = np.array([simulation_step(p) for p in step_statepoints], dtype=int)
+source_rate = float(source_rates[sim_steps[0]])
+power = power_by_step(step_statepoints, source_rates[sim_steps], volumes=volumes)
+
+# Standard deviations ride along every derived quantity (see uncertainty.py)
+heat_col, fiss_col = power['scores'].index('heating-local'), power['scores'].index('fission')
+power_by_material = np.zeros((len(times_s), len(power['materials'])))
+power_by_material_std = np.zeros_like(power_by_material)
+power_by_material[sim_steps] = power['power_W'][:, :, heat_col]
+power_by_material_std[sim_steps] = power['power_std_W'][:, :, heat_col]
+fiss_rate = np.zeros(len(times_s))
+fiss_rate_std = np.zeros(len(times_s))
+fiss_rate[sim_steps] = power['power_W'][:, :, fiss_col].sum(axis=1)
+fiss_rate_std[sim_steps] = quadrature(power['power_std_W'][:, :, fiss_col], axis=1)
+power_by_material, power_by_material_std, fiss_rate, fiss_rate_std = (
+    fill_cached(a, source_rates, transported)
+    for a in (power_by_material, power_by_material_std, fiss_rate, fiss_rate_std))
 
 fissions_at_start   = float(fiss_rate[idx_start])
 fissions_at_10hours = float(fiss_rate[idx_end])
 
 # Get mass
 try:
-    t_mass, pu239_mass = results.get_mass(U238_MAT_NAME, 'Pu239')
+    t_mass, pu239_mass = sum_over_zones(results.get_mass, 'Pu239')
     total_pu239_grams = float(pu239_mass[idx_end])
 except (ValueError, KeyError):
     total_pu239_grams = 0.0
 
-power_at_start_calc = fissions_at_start * MEV_PER_FISSION * MEV_TO_JOULES
-power_at_end_calc = fissions_at_10hours * MEV_PER_FISSION * MEV_TO_JOULES
+power_array = power_by_material.sum(axis=1)
+power_array_std = quadrature(power_by_material_std, axis=1)
+power_at_start_calc = float(power_array[idx_start])
+power_at_end_calc = float(power_array[idx_end])
 
 openmc.config['chain_file'] = '/workspaces/MEng172-OpenMC/models/FusionFissionReactor/Iteration1/chain_endfb80_pwr.xml'
 
-_, total_decay_heat = results.get_decay_heat(U238_MAT_NAME, units='W')
+_, total_decay_heat = sum_over_zones(results.get_decay_heat, units='W')
 
 times_s = np.array(results.get_times(time_units='s'))  # 's'|'min'|'h'|'d'
 assert len(times_s) >= 2, "Expected at least two depletion steps."
 
 def getReactorUpTime(times_s, idx_start, idx_end):
-    with h5py.File("depletion_results.h5", "r") as f:
+    with h5py.File(RESULTS_FILE, "r") as f:
         if "power" in f:
             power_watts = f["power"][()]
             power_watts = np.array(power_watts).reshape(-1)
         elif "source_rate" in f:
-            sr = f["source_rate"][()]
-            power_watts = sr[:, 0]
+            power_watts = read_source_rates(RESULTS_FILE)
         else:
-            raise RuntimeError("Neither 'power' nor 'source_rate' dataset found in depletion_results.h5")
+            raise RuntimeError(f"Neither 'power' nor 'source_rate' dataset found in {RESULTS_FILE}")
 
     if len(power_watts) != len(times_s):
         n = min(len(power_watts), len(times_s))
@@ -90,15 +151,15 @@ print(f"Reactor Metrics: Total Decay Heat - {total_decay_heat[1]} W")
 #total_energy_kwh = total_energy_joules / (3.6e6) 
 
 #integration method for power average over time
-power_array = fiss_rate * MEV_PER_FISSION * MEV_TO_JOULES
 dt = np.diff(times_s, prepend=0.0)
 total_energy_joules = np.sum(power_array * dt)
 total_energy_kwh = total_energy_joules / (3.6e6) 
+total_energy_std = float(cumulative_std(power_array_std, dt)[-1])
 
-print(f"Reactor Metrics: Power (kWh) - {total_energy_kwh} kWh")
-print(f"                       (or {total_energy_joules:.2f} Joules)")
-t_mass, pu239_mass = results.get_mass(U238_MAT_NAME, 'Pu239')
-t_mass, cm244_mass = results.get_mass(U238_MAT_NAME, 'Cm244')
+print(f"Reactor Metrics: Power (kWh) - {total_energy_kwh} kWh +/- {total_energy_std / 3.6e6:.2e} kWh")
+print(f"                       (or {fmt(total_energy_joules, total_energy_std)} Joules)")
+t_mass, pu239_mass = sum_over_zones(results.get_mass, 'Pu239')
+t_mass, cm244_mass = sum_over_zones(results.get_mass, 'Cm244')
 
 initial_cm244_mass = float(cm244_mass[0])
 final_cm244_mass   = float(cm244_mass[idx_end])
@@ -112,27 +173,28 @@ print(f"Reactor Metrics:Net Pu-239 Created(+)/Destroyed(-) {delta_pu239_grams:.6
 
 print(f"Reactor Metrics:Net Cm-244 Created(+)/Destroyed(-) {delta_cm244_mass:.6e} g")
 
-print(f"Reactor Metrics: Power @ Start (kW) - {power_at_start_calc / 1000:.2f} kW")
-print(f"Reactor Metrics: Power @ End (kW) - {power_at_end_calc / 1000:.2f} kW")
-
-
-sp = openmc.StatePoint('openmc_simulation_n1.h5')
-flux_t = sp.get_tally(name='flux_tally')
-raw_tally_value = flux_t.mean.ravel()[0]  # This is your 165.6
+print(f"Reactor Metrics: Power @ Start (kW) - {power_at_start_calc / 1000:.2f} +/- {power_array_std[idx_start] / 1000:.2f} kW")
+print(f"Reactor Metrics: Power @ End (kW) - {power_at_end_calc / 1000:.2f} +/- {power_array_std[idx_end] / 1000:.2f} kW")
+for j, mat_id in enumerate(power['materials']):
+    print(f"Reactor Metrics: Power in material {mat_id} @ Start/End (kW) - "
+          f"{power_by_material[idx_start, j] / 1000:.2f} +/- {power_by_material_std[idx_start, j] / 1000:.2f} / "
+          f"{power_by_material[idx_end, j] / 1000:.2f} +/- {power_by_material_std[idx_end, j] / 1000:.2f} kW")
 
-source_rate = 1.0e15  # n/s (Must match our simulation input)
 
-radius = 25.5
-volume_cm3 = (4/3) * math.pi * (radius ** 3)
-real_flux = (raw_tally_value * source_rate) / volume_cm3
+# Flux normalization: per-step source rate and per-material volumes from the run
+flux_norm = normalize_run(step_statepoints, source_rates[sim_steps], tally_name='flux_tally',
+                          volumes=volumes)
+flux_by_material = flux_norm['mean'][:, :, flux_norm['scores'].index('flux')]
+flux_by_material_std = flux_norm['std_dev'][:, :, flux_norm['scores'].index('flux')]
 
 print(f"--- Results ---")
-print(f"Raw Tally Mean:   {raw_tally_value:.3e} [cm per source particle]")
-print(f"Material Volume:  {volume_cm3:.2f} cm^3")
 print(f"Source Strength:  {source_rate:.1e} n/s")
 print("-" * 30)
-print(f"TRUE NEUTRON FLUX: {real_flux:.3e} n/cm^2-s")
-
+for j, mat_id in enumerate(flux_norm['materials']):
+    print(f"TRUE NEUTRON FLUX (material {mat_id}): {fmt(flux_by_material[0, j], flux_by_material_std[0, j])} n/cm^2-s")
+    for k, score in enumerate(flux_norm['scores']):
+        if score != 'flux':
+            print(f"    {score} rate density: {fmt(flux_norm['mean'][0, j, k], flux_norm['std_dev'][0, j, k])} 1/cm^3-s")
 
 # 3. Calculate Surface Area (m^2)
 # Your geometry is a sphere with radius 25.5 cm
@@ -142,53 +204,38 @@ surface_area_m2 = 4 * math.pi * (radius_m ** 2)
 
 # 4. Calculate Heat Flux (W/m^2)
 heat_flux = power_at_end_calc / surface_area_m2
+heat_flux_std = float(power_array_std[idx_end]) / surface_area_m2
 
 print("-" * 30)
-print(f"Total Heat Deposition: {power_at_end_calc:.2f} W")
+print(f"Total Heat Deposition: {power_at_end_calc:.2f} +/- {power_array_std[idx_end]:.2f} W")
 print(f"Surface Area:          {surface_area_m2:.4f} m^2")
 print("-" * 30)
-print(f"AVERAGE HEAT FLUX:     {heat_flux:.2f} W/m^2")
+print(f"AVERAGE HEAT FLUX:     {heat_flux:.2f} +/- {heat_flux_std:.2f} W/m^2")
 print("-" * 30)
 
 print("\nGenerating time-series arrays for graphing...")
 
 # 1. Power Array [Watts]
-# REUSE: 'fiss_rate' (the array you created earlier)
-# REUSE: 'MEV_PER_FISSION' and 'MEV_TO_JOULES' constants
-power_array = fiss_rate * MEV_PER_FISSION * MEV_TO_JOULES
+# REUSE: 'power_array' from the energy-deposition tally (summed over materials)
 
 # 2. Heat Flux Array [W/m^2]
 # REUSE: 'surface_area_m2'
 heat_flux_array = power_array / surface_area_m2
+heat_flux_array_std = power_array_std / surface_area_m2
 
 # 3. Neutron Flux Array [n/cm^2-s]
-# We must loop through files because 'real_flux' above was just for one snapshot.
-neutron_flux_list = []
+# One value per depletion step for the depleted material (all steps in one pass above)
 num_steps = len(times_s)
-
-print(f"Extracting flux history from {num_steps} statepoint files...")
-
-for i in range(num_steps):
-    filename = f"openmc_simulation_n{i}.h5"
-    
-    if os.path.exists(filename):
-        try:
-            with openmc.StatePoint(filename) as sp:
-                # REUSE: 'flux_tally' name logic, but load new object per file
-                tally = sp.get_tally(name='flux_tally')
-                raw_val = tally.mean.ravel()[0]
-                
-                # REUSE: 'source_rate' and 'volume_cm3' from your script
-                phys_flux = (raw_val * source_rate) / volume_cm3
-                neutron_flux_list.append(phys_flux)
-        except Exception as e:
-            # Fallback if file is corrupted or tally missing
-            neutron_flux_list.append(0.0)
-    else:
-        # Fallback if file missing
-        neutron_flux_list.append(0.0)
-
-neutron_flux_array = np.array(neutron_flux_list)
+print(f"Extracting flux history from {len(step_statepoints)} statepoint files...")
+neutron_flux_array = np.zeros(num_steps)
+neutron_flux_array_std = np.zeros(num_steps)
+# Volume-weighted over the zones of the shell
+mat_cols = [flux_norm['materials'].index(int(m)) for m in DEPLETED_MATS]
+zone_weights = flux_norm['volumes'][mat_cols] / flux_norm['volumes'][mat_cols].sum()
+neutron_flux_array[sim_steps] = flux_by_material[:, mat_cols] @ zone_weights
+neutron_flux_array_std[sim_steps] = weighted_std(flux_by_material_std[:, mat_cols], zone_weights)
+neutron_flux_array = fill_cached(neutron_flux_array, source_rates, transported)
+neutron_flux_array_std = fill_cached(neutron_flux_array_std, source_rates, transported)
 
 # ================= OUTPUTS FOR TEAMMATE =================
 # Copy-paste these arrays to send to your teammate
@@ -201,17 +248,21 @@ print("="*50)
 print(f"\n# 1. Time Steps [seconds]:")
 print(repr(times_s))
 
-print(f"\n# 2. Fission Rate [reactions/sec]:")
+print(f"\n# 2. Fission Rate [reactions/sec] (and 1-sigma):")
 print(repr(fiss_rate))
+print(repr(fiss_rate_std))
 
-print(f"\n# 3. Power [Watts]:")
+print(f"\n# 3. Power [Watts] (and 1-sigma):")
 print(repr(power_array))
+print(repr(power_array_std))
 
-print(f"\n# 4. Heat Flux [W/m^2]:")
+print(f"\n# 4. Heat Flux [W/m^2] (and 1-sigma):")
 print(repr(heat_flux_array))
+print(repr(heat_flux_array_std))
 
-print(f"\n# 5. Neutron Flux [n/cm^2-s]:")
+print(f"\n# 5. Neutron Flux [n/cm^2-s] (and 1-sigma):")
 print(repr(neutron_flux_array))
+print(repr(neutron_flux_array_std))
 print("="*50)
 
 # Constants
@@ -222,7 +273,7 @@ hm_isos = ['U238', 'U235', 'Pu239', 'Pu240', 'Pu241']
 M_HM = 0.0
 for iso in hm_isos:
     try:
-        _, mass_arr = results.get_mass(U238_MAT_NAME, iso, mass_units='kg')
+        _, mass_arr = sum_over_zones(results.get_mass, iso, mass_units='kg')
         M_HM += mass_arr[0]  # initial mass (kg)
     except (KeyError, ValueError):
         pass  # isotope not found
@@ -231,19 +282,21 @@ if M_HM == 0:
     raise RuntimeError("No heavy metal isotopes found for burnup calculation")
 
 # 2. Integrate energy over time
-#    Power array = fiss_rate * 200 MeV * 1.602e-13 J
+#    Power array = tallied heating-local summed over materials [W]
 dt = np.diff(times_s, prepend=0.0)
 energy_J = np.cumsum(power_array * dt)  # J at each step
+energy_J_std = cumulative_std(power_array_std, dt)
 
 # 3. Convert to MWd/kg
 burnup_MWd_per_kg = energy_J / (M_HM * JOULES_PER_MWd)
+burnup_MWd_per_kg_std = energy_J_std / (M_HM * JOULES_PER_MWd)
 
 # 4. Print and export
 print("\n--- BURNUP RESULTS ---")
-for i, bu in enumerate(burnup_MWd_per_kg):
-    print(f"Step {i:02d}: {bu:.6f} MWd/kg")
+for i, (bu, dbu) in enumerate(zip(burnup_MWd_per_kg, burnup_MWd_per_kg_std)):
+    print(f"Step {i:02d}: {bu:.6f} +/- {dbu:.1e} MWd/kg")
 
-print(f"\nFinal Burnup: {burnup_MWd_per_kg[-1]:.6f} MWd/kg")
+print(f"\nFinal Burnup: {burnup_MWd_per_kg[-1]:.6f} +/- {burnup_MWd_per_kg_std[-1]:.1e} MWd/kg")
 
 # 5. K_eff Array
 #sp = openmc.StatePoint('openmc_simulation_n1.h5')
@@ -251,5 +304,71 @@ print(f"\nFinal Burnup: {burnup_MWd_per_kg[-1]:.6f} MWd/kg")
 #print(f"K-effective: {keff:.6f}")
 
 # Optional: include in your export arrays
-print(f"\n# 6. Burnup [MWd/kg]:")
+print(f"\n# 6. Burnup [MWd/kg] (and 1-sigma):")
 print(repr(burnup_MWd_per_kg))
+print(repr(burnup_MWd_per_kg_std))
+
+# Are more particles worth it? Relative error of each end-of-run metric and
+# the histories per step needed for 1% (error falls as 1/sqrt(histories))
+with openmc.StatePoint(step_statepoints[-1], autolink=False) as sp:
+    histories = sp.n_particles * (sp.n_batches - (sp.n_inactive or 0))
+metrics = {
+    'power': (power_at_end_calc, power_array_std[idx_end]),
+    'fission rate': (fiss_rate[idx_end], fiss_rate_std[idx_end]),
+    'heat flux': (heat_flux, heat_flux_std),
+    'neutron flux': (neutron_flux_array[idx_end], neutron_flux_array_std[idx_end]),
+    'burnup': (burnup_MWd_per_kg[-1], burnup_MWd_per_kg_std[-1]),
+}
+rel_errs = relative(*map(np.array, zip(*metrics.values())))
+needed = particles_needed(rel_errs, 0.01, histories)
+print(f"\n--- STATISTICAL PRECISION ({histories} histories per step) ---")
+for (name, _), rel, n in zip(metrics.items(), rel_errs, needed):
+    print(f"{name:13s} rel. error {100.0 * rel:6.2f}%   histories for 1%: {n:.2e}")
+
+# 7. Dose-rate map from the mesh dose tally (first transport step)
+if step_statepoints:
+    with openmc.StatePoint(step_statepoints[0]) as sp:
+        try:
+            dose_map, dose_std, dose_mesh = dose_rate_map(sp, source_rate)
+        except LookupError:
+            dose_map = None
+    if dose_map is not None:
+        peak = np.unravel_index(np.argmax(dose_map), dose_map.shape)
+        print("\n--- DOSE RATE MAP ---")
+        print(f"Peak Dose Rate:   {dose_map[peak]:.3e} Sv/h at voxel {peak}")
+        np.save("dose_rate_map.npy", dose_map)
+        plot_isodose(dose_map, dose_mesh, levels=[1e-6, 1e-4, 1e-2, 1.0], filename="isodose_z.png")
+        print("Saved dose_rate_map.npy and isodose_z.png")
+
+# 8. Archive the mostly-empty 80^3 heating mesh in sparse form (occupied voxels only)
+for i, path in zip(sim_steps, step_statepoints):
+    with openmc.StatePoint(path) as sp:
+        has_heating = any(t.name == '3d_heating_tally' for t in sp.tallies.values())
+    if has_heating:
+        sparse_heating = sparse_from_statepoint(path, '3d_heating_tally')
+        save_sparse(sparse_heating, f"heating_sparse_n{i}.npz")
+        n_voxels = int(np.prod(sparse_heating['dimension']))
+        print(f"Step {i:02d}: heating mesh {len(sparse_heating['index'])}/{n_voxels} occupied voxels "
+              f"-> heating_sparse_n{i}.npz")
+
+# 9. Radial profiles from the shell-aligned spherical mesh (first transport step)
+if step_statepoints:
+    with openmc.StatePoint(step_statepoints[0]) as sp:
+        if any(t.name == 'radial_tally' for t in sp.tallies.values()):
+            r_mid, radial_flux, radial_flux_std = radial_profile(sp, score='flux', source_rate=source_rate)
+            _, radial_heat, _ = radial_profile(sp, score='heating', source_rate=source_rate * EV_TO_JOULES)
+            print("\n--- RADIAL PROFILES ---")
+            print(" r [cm]      flux [n/cm^2-s]      heating [W/cm^3]")
+            for r, phi, dphi, q in zip(r_mid, radial_flux, radial_flux_std, radial_heat):
+                print(f"{r:7.2f}   {phi:.3e} +/- {dphi:.1e}   {q:.3e}")
+
+# 10. Radial inventory profiles across the depletion zones (end of irradiation)
+if zones:
+    r_zone, _, zone_mass, zone_density = radial_inventory(results, zones, ['U238', 'Pu239', 'Pu240', 'Cs137'])
+    np.savez("radial_inventory.npz", r_mid=r_zone, times_s=times_s,
+             **{f"{nuc}_g_per_cm3": rho for nuc, rho in zone_density.items()})
+    print("\n--- RADIAL INVENTORY (end of irradiation) ---")
+    print(" r [cm]   " + "   ".join(f"{nuc:>10s} g/cm^3" for nuc in zone_density))
+    for j, r in enumerate(r_zone):
+        print(f"{r:7.2f}   " + "   ".join(f"{zone_density[nuc][-1, j]:17.4e}" for nuc in zone_density))
+    print("Saved radial_inventory.npz")
@@ -0,0 +1,207 @@
+import copy
+import json
+import numpy as np
+
+SECONDS_PER_DAY = 24.0 * 3600.0
+SCHEDULE_FILE = "schedule_steps.json"
+
+
+class Schedule:
+    """
+    Source-rate timeline for a pulsed operating history, compiled into
+    depletion steps.
+
+    - constant(duration, rate, n_steps) a steady interval
+    - pulses(n, on, off, rate) a pulse train; unresolved trains (the default)
+      become one interval at the time-averaged rate, which is what burnup
+      sees when the period is far shorter than any depletion step
+    - outage(duration) zero source (decay only)
+    - ramp(duration, start_rate, end_rate, n_steps) piecewise-constant ramp
+    - compile() returns timesteps, source rates and which steps need transport
+    """
+
+    def __init__(self):
+        self.segments = []  # (duration_s, source_rate, max_step_s)
+
+    def constant(self, duration, rate, n_steps=1):
+        self.segments.append((float(duration), float(rate), float(duration) / n_steps))
+        return self
+
+    def pulses(self, n, on, off, rate, resolve=False, max_step=None):
+        if not resolve:
+            duration = n * (on + off)
+            return self.constant(duration, rate * on / (on + off),
+                                 n_steps=max(1, int(np.ceil(duration / max_step))) if max_step else 1)
+        for _ in range(n):
+            self.segments.append((float(on), float(rate), float(on)))
+            if off > 0.0:
+                self.segments.append((float(off), 0.0, float(off)))
+        return self
+
+    def outage(self, duration):
+        self.segments.append((float(duration), 0.0, float(duration)))
+        return self
+
+    def ramp(self, duration, start_rate, end_rate, n_steps=5):
+        dt = float(duration) / n_steps
+        # Each step at the rate of its midpoint
+        for i in range(n_steps):
+            rate = start_rate + (end_rate - start_rate) * (i + 0.5) / n_steps
+            self.segments.append((dt, float(rate), dt))
+        return self
+
+    @property
+    def duration(self):
+        return sum(s[0] for s in self.segments)
+
+    def compile(self, refresh_after=30.0 * SECONDS_PER_DAY):
+        """
+        Turns the timeline into depletion steps.
+
+        - Consecutive zero-source intervals merge into a single decay-only
+          step (openmc.deplete runs no transport for a zero source rate)
+        - Non-zero intervals are split at their max step length
+        - A step at the same source rate as the last transported one (e.g.
+          the next pulse of a train) reuses its reaction rates; transport
+          reruns once refresh_after seconds have passed so the rates follow
+          the burnup
+        - Returns: (timesteps_s, source_rates, transport) lists of equal length
+        """
+
+        steps = []
+        for duration, rate, max_step in self.segments:
+            if rate == 0.0:
+                if steps and steps[-1][1] == 0.0:
+                    steps[-1] = (steps[-1][0] + duration, 0.0)
+                else:
+                    steps.append((duration, 0.0))
+                continue
+            n = max(1, int(np.ceil(duration / max_step - 1e-9)))
+            steps += [(duration / n, rate)] * n
+
+        transport = []
+        t, last_time, last_rate = 0.0, None, None
+        for duration, rate in steps:
+            if rate == 0.0:
+                transport.append(False)
+            elif rate == last_rate and t - last_time < refresh_after:
+                transport.append(False)
+            else:
+                transport.append(True)
+                last_time, last_rate = t, rate
+            t += duration
+        return [s[0] for s in steps], [s[1] for s in steps], transport
+
+
+class CachedRateOperator:
+    """
+    Wraps a depletion operator so steps flagged by Schedule.compile() as not
+    needing transport reuse the last transported reaction rates.
+
+    With source-rate normalization the rates are linear in the source, so
+    cached rates are scaled by the ratio of source rates. Zero-source steps
+    are decay only and pass straight through, so the flags are consumed for
+    non-zero steps only. Everything else, including the context-manager
+    protocol older openmc.deplete integrators use, is delegated to the
+    wrapped operator.
+
+    openmc.deplete still writes openmc_simulation_n<i>.h5 for cached and
+    decay-only steps, holding the tallies of the last transport solve; use
+    transported_steps() to tell them apart.
+    """
+
+    def __init__(self, operator, source_rates, transport):
+        self._operator = operator
+        # One flag per operator call: every non-zero step, plus the end-of-life
+        # solve, which always runs transport
+        self._flags = [t for t, r in zip(transport, source_rates) if r != 0.0] + [True]
+        self._call = 0
+        self._cached = None
+        self.transport_solves = 0
+
+    def __getattr__(self, name):
+        return getattr(self._operator, name)
+
+    # Special methods are looked up on the type, so __getattr__ misses them
+    def __enter__(self):
+        return self._operator.__enter__()
+
+    def __exit__(self, *exc):
+        return self._operator.__exit__(*exc)
+
+    def __call__(self, vec, source_rate):
+        if source_rate == 0.0:
+            return self._operator(vec, source_rate)
+        flag = self._flags[self._call] if self._call < len(self._flags) else True
+        self._call += 1
+        if flag or self._cached is None:
+            result = self._operator(vec, source_rate)
+            self._cached = (copy.deepcopy(result), source_rate)
+            self.transport_solves += 1
+            return result
+
+        cached, cached_rate = self._cached
+        rates = copy.deepcopy(cached.rates)
+        rates *= source_rate / cached_rate
+        return cached._replace(rates=rates)
+
+
+def save_transport_flags(transport, path=SCHEDULE_FILE):
+    with open(path, 'w') as f:
+        json.dump({'transport': [bool(t) for t in transport]}, f)
+
+
+def load_transport_flags(path=SCHEDULE_FILE):
+    with open(path) as f:
+        return json.load(f)['transport']
+
+
+def transported_steps(source_rates, transport=None):
+    """
+    Which entries of a depletion run (n_steps + 1, including end of life) had
+    a fresh transport solve: non-zero source rate and, for a compiled
+    schedule, flagged for transport. The end-of-life solve always runs
+    transport unless its source rate is zero.
+
+    - source_rates: per entry, as normalization.read_source_rates()
+    - transport: flags from Schedule.compile(); None means every step
+    - Returns: boolean array, one per entry
+    """
+
+    source_rates = np.asarray(source_rates, float)
+    flags = np.ones(len(source_rates), dtype=bool)
+    if transport is not None:
+        flags[:len(transport)] = np.asarray(transport, dtype=bool)[:len(source_rates)]
+    return flags & (source_rates > 0.0)
+
+
+def fill_cached(values, source_rates, transported):
+    """
+    Values of steps that reused cached reaction rates, as CachedRateOperator
+    does: the last transported step's values scaled by the source-rate ratio.
+    Decay-only steps are left as they are. values: array with steps on axis 0.
+    """
+
+    values = np.array(values, dtype=float)
+    last = None
+    for i, rate in enumerate(source_rates):
+        if transported[i]:
+            last = i
+        elif rate > 0.0 and last is not None:
+            values[i] = values[last] * (rate / source_rates[last])
+    return values
+
+
+if __name__ == "__main__":
+    # Example: 5 years of 0.1 Hz shots with a 30 day outage every year,
+    # ramping up over the first week
+    year = 365.0 * SECONDS_PER_DAY
+    schedule = Schedule()
+    schedule.ramp(7 * SECONDS_PER_DAY, 0.0, 1.0e15, n_steps=3)
+    for _ in range(5):
+        schedule.pulses(n=int((year - 30 * SECONDS_PER_DAY) / 10.0), on=1.0, off=9.0, rate=1.0e15,
+                        max_step=30 * SECONDS_PER_DAY)
+        schedule.outage(30 * SECONDS_PER_DAY)
+    timesteps, rates, transport = schedule.compile()
+    print(f"{len(timesteps)} depletion steps over {schedule.duration / year:.2f} years, "
+          f"{sum(transport)} transport solves, {rates.count(0.0)} decay-only steps")
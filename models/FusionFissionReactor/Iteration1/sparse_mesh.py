@@ -0,0 +1,128 @@
+import openmc
+import numpy as np
+import h5py
+
+
+def sparse_from_statepoint(statepoint_path, tally_name='3d_heating_tally', rel_threshold=0.0, chunk_rows=65_536):
+    """
+    Extracts a mesh tally from a statepoint in coordinate (COO) form.
+
+    Only voxels whose |sum| exceeds rel_threshold * max|sum| are kept
+    (rel_threshold=0 keeps every voxel that scored anything). The dense
+    results are streamed chunk_rows voxels at a time, so memory scales with
+    occupied voxels rather than the full 80^3 x sum/sum_sq array.
+
+    - Returns: dict with flat voxel 'index' (x fastest, as openmc orders
+      mesh bins), 'sum'/'sum_sq' of shape (n_occupied, n_values),
+      'n_realizations' and the mesh description
+    """
+
+    with openmc.StatePoint(statepoint_path, autolink=False) as sp:
+        tally = sp.get_tally(name=tally_name)
+        mesh = tally.find_filter(openmc.MeshFilter).mesh
+        meta = {
+            'tally_id': tally.id,
+            'dimension': np.array(mesh.dimension),
+            'lower_left': np.array(mesh.lower_left, dtype=float),
+            'upper_right': np.array(mesh.upper_right, dtype=float),
+            'scores': np.array(tally.scores),
+            'nuclides': np.array(tally.nuclides),
+            'n_realizations': int(tally.num_realizations),
+        }
+
+    with h5py.File(statepoint_path, 'r') as f:
+        results = f['tallies'][f"tally {meta['tally_id']}"]['results']
+        n_rows = results.shape[0]
+
+        # First pass for the threshold (only needs the running maximum)
+        cutoff = 0.0
+        if rel_threshold > 0.0:
+            peak = 0.0
+            for start in range(0, n_rows, chunk_rows):
+                peak = max(peak, float(np.abs(results[start:start + chunk_rows, :, 0]).max()))
+            cutoff = rel_threshold * peak
+
+        index, sums, sums_sq = [], [], []
+        for start in range(0, n_rows, chunk_rows):
+            block = results[start:start + chunk_rows]
+            keep = np.flatnonzero(np.abs(block[:, :, 0]).max(axis=1) > cutoff)
+            index.append(keep + start)
+            sums.append(block[keep, :, 0])
+            sums_sq.append(block[keep, :, 1])
+
+    meta.pop('tally_id')
+    meta.update(index=np.concatenate(index), sum=np.concatenate(sums), sum_sq=np.concatenate(sums_sq))
+    return meta
+
+
+def save_sparse(sparse, path):
+    # Compressed, so archives scale with occupied voxels
+    np.savez_compressed(path, **sparse)
+
+
+def load_sparse(path):
+    with np.load(path) as data:
+        sparse = {key: data[key] for key in data.files}
+    sparse['n_realizations'] = int(sparse['n_realizations'])
+    return sparse
+
+
+def sparse_mean_std(sparse):
+    """
+    Mean and standard deviation of the mean for the occupied voxels only.
+    """
+
+    n = sparse['n_realizations']
+    mean = sparse['sum'] / n
+    if n > 1:
+        var = np.maximum(sparse['sum_sq'] / n - mean**2, 0.0) / (n - 1)
+    else:
+        var = np.zeros_like(mean)
+    return mean, np.sqrt(var)
+
+
+def to_dense(sparse, stat='mean', value=0):
+    """
+    Dense view of one value column ('mean' or 'std_dev') shaped like the mesh
+    (x fastest, i.e. the same as tally.mean.reshape(dimension, order='F')).
+    """
+
+    mean, std = sparse_mean_std(sparse)
+    column = (mean if stat == 'mean' else std)[:, value]
+    dim = tuple(int(d) for d in sparse['dimension'])
+    dense = np.zeros(int(np.prod(dim)))
+    dense[sparse['index']] = column
+    return dense.reshape(dim, order='F')
+
+
+def voxel_centers(sparse):
+    """
+    (x, y, z) centres of the occupied voxels, for scatter/volume plots that
+    only need to load scoring voxels.
+    """
+
+    dim = sparse['dimension']
+    width = (sparse['upper_right'] - sparse['lower_left']) / dim
+    ijk = np.stack(np.unravel_index(sparse['index'], tuple(int(d) for d in dim), order='F'), axis=1)
+    return sparse['lower_left'] + (ijk + 0.5) * width
+
+
+def merge_sparse(sparse_list):
+    """
+    Merges sparse tallies of independent runs on the same mesh (e.g. ensemble
+    replicas) by pooling sum/sum_sq and realizations over the union of voxels.
+    """
+
+    first = sparse_list[0]
+    index = np.unique(np.concatenate([s['index'] for s in sparse_list]))
+    total = np.zeros((index.size,) + first['sum'].shape[1:])
+    total_sq = np.zeros_like(total)
+    for s in sparse_list:
+        rows = np.searchsorted(index, s['index'])
+        total[rows] += s['sum']
+        total_sq[rows] += s['sum_sq']
+
+    merged = {k: v for k, v in first.items() if k not in ('index', 'sum', 'sum_sq', 'n_realizations')}
+    merged.update(index=index, sum=total, sum_sq=total_sq,
+                  n_realizations=sum(s['n_realizations'] for s in sparse_list))
+    return merged
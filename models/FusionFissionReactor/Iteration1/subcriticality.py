@@ -0,0 +1,152 @@
+import openmc
+import openmc.deplete
+import numpy as np
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'NeutronSource'))
+from source_bank import SOURCEPOINT
+
+SUBCRIT_DIR = "subcriticality"
+K_LIMIT = 0.95  # maximum allowed k-eff for the blanket (k + n_sigma * sigma)
+
+
+def fissionable_box_source(geometry):
+    """
+    Cold-start source: uniform over the bounding box, only accepted in
+    fissionable material (the spent-fuel shell).
+    """
+
+    lower_left, upper_right = geometry.bounding_box
+    try:
+        return openmc.IndependentSource(space=openmc.stats.Box(lower_left, upper_right),
+                                        constraints={'fissionable': True})
+    except TypeError:
+        # openmc 0.14 has no source constraints yet
+        return openmc.IndependentSource(space=openmc.stats.Box(lower_left, upper_right, only_fissionable=True))
+
+
+def to_eigenvalue(model, particles=10_000, batches=50, inactive=20, source=None):
+    """
+    Switches a (fixed-source) model to an eigenvalue companion run that also
+    writes its fission source bank for the next case to warm-start from.
+    """
+
+    model.settings.run_mode = 'eigenvalue'
+    model.settings.particles = particles
+    model.settings.batches = batches
+    model.settings.inactive = inactive
+    model.settings.source = source or fissionable_box_source(model.geometry)
+    model.settings.sourcepoint = dict(SOURCEPOINT)
+    model.tallies = openmc.Tallies()
+    return model
+
+
+def apply_depleted_compositions(model, results, step, materials_xml="materials.xml"):
+    """
+    Replaces the composition of every depleted material in `model` with its
+    composition at depletion `step` (cells keep pointing at the same objects).
+    Materials are matched by id, so model must be built the way the depletion
+    run built it (same zoning); materials that were not depleted are left as is.
+    """
+
+    depleted = {m.id: m for m in results.export_to_materials(step, path=materials_xml)}
+    for mat in model.materials:
+        new = depleted.get(mat.id)
+        if new is None:
+            continue
+        for name in list(mat.get_nuclides()):
+            mat.remove_nuclide(name)
+        for nuc in new.nuclides:
+            mat.add_nuclide(nuc.name, nuc.percent, nuc.percent_type)
+        mat.set_density('sum')
+    return model
+
+
+def depletion_step_cases(build_model, results_path="depletion_results.h5", materials_xml="materials.xml"):
+    """
+    One case per depletion step: build_model() with that step's compositions.
+    materials_xml is the file written by the depletion run (reactor.py).
+    Returns: list of (name, zero-argument builder)
+    """
+
+    results = openmc.deplete.Results(results_path)
+    return [(f"step_{i:02d}", lambda i=i: apply_depleted_compositions(build_model(), results, i, materials_xml))
+            for i in range(len(results))]
+
+
+def _run_chain(chain, start_bank, particles, batches, cold_inactive, warm_inactive, threads=None):
+    keffs = {}
+    bank = start_bank
+    for name, build in chain:
+        model = build()
+        if bank is None:
+            to_eigenvalue(model, particles, batches, cold_inactive)
+        else:
+            # Warm start: previous case's converged fission source, fewer inactive batches
+            to_eigenvalue(model, particles, batches - cold_inactive + warm_inactive, warm_inactive,
+                          source=openmc.FileSource(bank))
+        # Chains run concurrently: Model.run() chdirs the whole process, so
+        # export into the case directory and run openmc as a subprocess there
+        run_dir = os.path.abspath(os.path.join(SUBCRIT_DIR, name))
+        os.makedirs(run_dir, exist_ok=True)
+        model.export_to_xml(directory=run_dir)
+        openmc.run(cwd=run_dir, output=False, threads=threads)
+        sp_path = os.path.join(run_dir, f"statepoint.{model.settings.batches}.h5")
+        with openmc.StatePoint(sp_path, autolink=False) as sp:
+            keffs[name] = (float(sp.keff.nominal_value), float(sp.keff.std_dev))
+        bank = os.path.join(run_dir, 'source.h5')
+        print(f"{name}: k-eff = {keffs[name][0]:.5f} +/- {keffs[name][1]:.5f}")
+    return keffs
+
+
+def subcriticality_sweep(cases, k_limit=K_LIMIT, n_sigma=3.0, workers=4, particles=10_000,
+                         batches=50, cold_inactive=20, warm_inactive=5):
+    """
+    Computes k-eff for every case and flags any that is not safely subcritical.
+
+    - cases: ordered list of (name, builder) with builder() -> openmc.Model;
+      neighbouring cases should be similar (radius sweep, consecutive steps)
+    - The first case runs cold; the rest are split into `workers` chains that
+      run in parallel (cores shared between them), each case warm-started
+      from the previous one's bank
+    - Returns: {name: {'keff', 'std', 'flagged'}}
+    """
+
+    first, rest = cases[0], cases[1:]
+    keffs = _run_chain([first], None, particles, batches, cold_inactive, warm_inactive)
+    reference_bank = os.path.abspath(os.path.join(SUBCRIT_DIR, first[0], 'source.h5'))
+
+    chains = [list(c) for c in np.array_split(np.array(rest, dtype=object), min(workers, len(rest)))] if rest else []
+    n_workers = max(1, len(chains))
+    threads = max(1, (os.cpu_count() or 1) // n_workers)
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        for result in pool.map(lambda c: _run_chain(c, reference_bank, particles, batches,
+                                                    cold_inactive, warm_inactive, threads), chains):
+            keffs.update(result)
+
+    report = {}
+    for name, _ in cases:
+        k, std = keffs[name]
+        flagged = k + n_sigma * std > k_limit
+        report[name] = {'keff': k, 'std': std, 'flagged': flagged}
+        if flagged:
+            print(f"WARNING: {name} k-eff {k:.5f} +/- {std:.5f} exceeds subcriticality limit {k_limit}")
+    return report
+
+
+if __name__ == "__main__":
+    from fuel_blanket import build_spentfuelsphere_albox
+
+    def blanket_variant(inner):
+        def build():
+            geometry, materials = build_spentfuelsphere_albox(20.0, 20.0, inner, 100.0)
+            return openmc.Model(geometry, materials, openmc.Settings())
+        return build
+
+    # Blanket variants, then every depletion step of the reactor.py run
+    cases = [(f"rin_{r:g}", blanket_variant(r)) for r in (40.0, 45.0, 50.0, 55.0, 60.0)]
+    if os.path.exists("depletion_results.h5"):
+        cases += depletion_step_cases(blanket_variant(50.0))
+    subcriticality_sweep(cases)
@@ -0,0 +1,137 @@
+import openmc
+import h5py
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+
+from volumes import geometry_hash
+
+SURFACE_SOURCE_DIR = "surface_source"
+
+
+def build_source_region(box_side, box_width):
+    """
+    Builds only the fixed inner region of the Iteration1 design: the z-pinch
+    vacuum and the aluminum box, with a VACUUM boundary on the box's outer wall.
+
+    Every particle that reaches Al_box_outer_wall is recorded once (on its
+    first outward crossing) and killed, so the recorded bank is exactly what
+    the blanket sees in the full model. Re-entry into the box is handled in
+    the replay stage, which uses the full geometry.
+
+    - Same dimensions/material as build_spentfuelsphere_albox
+    - Returns: (geometry, materials, surface_ids of the six outer-wall planes)
+    """
+
+    aluminum = openmc.Material(name='aluminum')
+    aluminum.add_element('Al', 1)
+    aluminum.set_density('g/cm3', 2.7)
+    materials = openmc.Materials([aluminum])
+
+    half_in = box_side / 2
+    half_out = (box_side + box_width) / 2
+    Al_box_inner_wall = openmc.model.RectangularParallelepiped(-half_in, half_in, -half_in, half_in, -half_in, half_in)
+    Al_box_outer_wall = openmc.model.RectangularParallelepiped(-half_out, half_out, -half_out, half_out, -half_out, half_out,
+                                                               boundary_type='vacuum')
+
+    inner_box_vacuum_cell = openmc.Cell(name='inner_Al_vacuum', region=-Al_box_inner_wall)
+    al_box_cell = openmc.Cell(name='al_box', fill=aluminum, region=+Al_box_inner_wall & -Al_box_outer_wall)
+    geometry = openmc.Geometry([inner_box_vacuum_cell, al_box_cell])
+
+    planes = [Al_box_outer_wall.xmin, Al_box_outer_wall.xmax, Al_box_outer_wall.ymin,
+              Al_box_outer_wall.ymax, Al_box_outer_wall.zmin, Al_box_outer_wall.zmax]
+    return geometry, materials, [p.id for p in planes]
+
+
+def record_surface_source(geometry, materials, source, surface_ids, particles=1_000_000, batches=10,
+                          max_particles=None, threads=None, cache_dir=SURFACE_SOURCE_DIR):
+    """
+    Stage 1: transports the inner region once with high statistics and writes
+    every crossing of surface_ids to surface_source.h5.
+
+    - Cached by geometry hash + source + statistics
+    - Returns: (path to surface_source.h5, crossings per source neutron)
+    """
+
+    if max_particles is None:
+        max_particles = 4 * particles * batches
+
+    settings = openmc.Settings()
+    settings.run_mode = 'fixed source'
+    settings.particles = particles
+    settings.batches = batches
+    settings.source = source
+    settings.surf_source_write = {'surface_ids': list(surface_ids), 'max_particles': max_particles}
+
+    # Source XML covers its spatial/energy/angle distributions and strength
+    source_hash = hashlib.sha256(ET.tostring(source.to_xml_element())).hexdigest()[:8]
+    key = f"{geometry_hash(geometry, materials)}_{source_hash}_{particles}x{batches}"
+    run_dir = os.path.join(cache_dir, key)
+    bank = os.path.join(run_dir, 'surface_source.h5')
+    meta = os.path.join(run_dir, 'surface_source.json')
+    if os.path.exists(bank) and os.path.exists(meta):
+        print(f"Using cached surface source {bank}")
+        with open(meta) as f:
+            return bank, json.load(f)['crossings_per_source']
+
+    os.makedirs(run_dir, exist_ok=True)
+    model = openmc.Model(geometry=geometry, materials=materials, settings=settings)
+    print(f"Recording surface source ({particles * batches} histories)...")
+    model.run(threads=threads, cwd=run_dir)
+
+    with h5py.File(bank, 'r') as f:
+        n_recorded = f['source_bank'].shape[0]
+    if n_recorded >= max_particles:
+        raise RuntimeError(f"Surface source bank is full ({max_particles}); increase max_particles")
+
+    crossings_per_source = n_recorded / float(particles * batches)
+    with open(meta, 'w') as f:
+        json.dump({'recorded': n_recorded, 'histories': particles * batches,
+                   'crossings_per_source': crossings_per_source}, f, indent=2)
+    return bank, crossings_per_source
+
+
+def replay_source(bank):
+    """
+    Stage 2: returns a source that replays the recorded surface crossings.
+
+    Tallies from a replay run are per recorded crossing; multiply them (or the
+    depletion source rate) by crossings_per_source to get per z-pinch neutron.
+    """
+
+    # Absolute, since replay runs use their own working directory
+    return openmc.FileSource(os.path.abspath(bank))
+
+
+if __name__ == "__main__":
+    from fuel_blanket import build_spentfuelsphere_albox
+    from neutronsource import create_cylindrical_source
+
+    box_side, box_width = 20.0, 20.0
+    z_pinch = create_cylindrical_source(height=5.0, radius=1.0, e_min=2.3e6, e_max=2.5e6)
+
+    # Stage 1: the fixed inner region, transported once
+    geometry, materials, surface_ids = build_source_region(box_side, box_width)
+    bank, crossings_per_source = record_surface_source(geometry, materials, z_pinch, surface_ids)
+
+    # Stage 2: each blanket variant only transports from the box wall outwards
+    for inner in (40.0, 50.0, 60.0):
+        geometry, materials = build_spentfuelsphere_albox(box_side, box_width, inner, 100.0)
+        settings = openmc.Settings()
+        settings.run_mode = 'fixed source'
+        settings.particles = 10_000
+        settings.batches = 3
+        settings.source = replay_source(bank)
+
+        flux_tally = openmc.Tally(name='flux_tally')
+        flux_tally.filters = [openmc.MaterialFilter(materials)]
+        flux_tally.scores = ['flux']
+
+        run_dir = f"replay_rin{inner:g}"
+        os.makedirs(run_dir, exist_ok=True)
+        model = openmc.Model(geometry, materials, settings, openmc.Tallies([flux_tally]))
+        sp_path = model.run(cwd=run_dir)
+        with openmc.StatePoint(sp_path) as sp:
+            flux = sp.get_tally(name='flux_tally').mean.ravel() * crossings_per_source
+        print(f"inner radius {inner:g} cm: flux per z-pinch neutron by material {flux}")
@@ -0,0 +1,63 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+h5py = pytest.importorskip("h5py")
+pytest.importorskip("openmc")
+
+from compact_results import CompactResults, compact_results
+
+
+def write_depletion_file(path, n_steps, t0=0.0):
+    # Minimal openmc.deplete results layout: one material, U238/Pu239 tracked
+    # and rated, Xe135 tracked only
+    with h5py.File(path, 'w') as f:
+        f.create_group('materials/1').attrs.update({'index': 0, 'volume': 10.0})
+        f.create_group('nuclides/U238').attrs.update({'atom number index': 0, 'reaction rate index': 0})
+        f.create_group('nuclides/Pu239').attrs.update({'atom number index': 1, 'reaction rate index': 1})
+        f.create_group('nuclides/Xe135').attrs['atom number index'] = 2
+        f.create_group('reactions/fission').attrs['index'] = 0
+
+        steps = np.arange(n_steps, dtype=float)
+        number = np.zeros((n_steps, 1, 1, 3))
+        number[:, 0, 0] = np.column_stack([1.0e24 - steps, steps, 0.5 * steps])
+        rates = np.zeros((n_steps, 1, 1, 2, 1))
+        rates[:, 0, 0, 1, 0] = 1.0e10 * steps
+        f['number'] = number
+        f['reaction rates'] = rates
+        f['time'] = np.column_stack([t0 + 10.0 * steps, t0 + 10.0 * (steps + 1)])
+        f['source_rate'] = np.full((n_steps, 1), 1.0e15)
+
+
+def test_compact_into_new_file(tmp_path):
+    results_path, out_path = tmp_path / "depletion_results.h5", tmp_path / "compact.h5"
+    write_depletion_file(results_path, 3)
+
+    assert compact_results(results_path, out_path) == 3
+    with CompactResults(out_path) as compact:
+        np.testing.assert_allclose(compact.get_times(), [0.0, 10.0, 20.0])
+        np.testing.assert_allclose(compact.get_atoms('1', 'Pu239')[1], [0.0, 1.0, 2.0])
+        np.testing.assert_allclose(compact.get_atoms('1', 'Xe135')[1], [0.0, 0.5, 1.0])
+        np.testing.assert_allclose(compact.get_reaction_rate('1', 'Pu239', 'fission')[1], [0.0, 1.0e10, 2.0e10])
+        assert compact.volume == {'1': 10.0}
+
+
+def test_append_only_new_steps(tmp_path):
+    results_path, out_path = tmp_path / "depletion_results.h5", tmp_path / "compact.h5"
+    write_depletion_file(results_path, 2)
+    compact_results(results_path, out_path)
+    write_depletion_file(results_path, 4)
+
+    assert compact_results(results_path, out_path) == 2
+    assert compact_results(results_path, out_path) == 0
+    with CompactResults(out_path) as compact:
+        np.testing.assert_allclose(compact.get_atoms('1', 'U238')[1], 1.0e24 - np.arange(4.0))
+
+
+def test_refuses_other_run(tmp_path):
+    results_path, out_path = tmp_path / "depletion_results.h5", tmp_path / "compact.h5"
+    write_depletion_file(results_path, 2)
+    compact_results(results_path, out_path)
+    write_depletion_file(results_path, 3, t0=5.0)
+
+    with pytest.raises(ValueError):
+        compact_results(results_path, out_path)
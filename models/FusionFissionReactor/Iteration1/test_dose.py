@@ -0,0 +1,22 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+openmc = pytest.importorskip("openmc")
+
+from dose import build_dose_tally
+
+
+def test_dose_filter_interpolates_log_log():
+    mesh = openmc.RegularMesh()
+    mesh.dimension = [2, 2, 2]
+    mesh.lower_left = [-1.0, -1.0, -1.0]
+    mesh.upper_right = [1.0, 1.0, 1.0]
+
+    tally = build_dose_tally(mesh, geometry='ISO')
+    dose_filter = tally.find_filter(openmc.EnergyFunctionFilter)
+    energies, coeffs = openmc.data.dose_coefficients('neutron', geometry='ISO')
+
+    assert dose_filter.interpolation == 'log-log'
+    np.testing.assert_allclose(dose_filter.energy, energies)
+    np.testing.assert_allclose(dose_filter.y, coeffs)
+    assert tally.scores == ['flux']
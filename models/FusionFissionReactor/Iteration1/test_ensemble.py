@@ -0,0 +1,33 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+h5py = pytest.importorskip("h5py")
+pytest.importorskip("openmc")
+
+from ensemble import merge_statepoints
+
+
+def write_statepoint(path, sums, n_realizations):
+    # Minimal statepoint tally layout: results[bin, score, (sum, sum_sq)]
+    sums = np.asarray(sums, dtype=float).reshape(-1, 1)
+    with h5py.File(path, 'w') as f:
+        f['n_realizations'] = n_realizations
+        f.create_group('tallies/filters')
+        tally = f.create_group('tallies/tally 1')
+        tally['results'] = np.stack([sums, sums**2], axis=-1)
+        tally['n_realizations'] = n_realizations
+
+
+def test_pools_sums_and_realizations(tmp_path):
+    paths = [tmp_path / "a.h5", tmp_path / "b.h5"]
+    write_statepoint(paths[0], [1.0, 2.0, 3.0, 4.0, 5.0], 3)
+    write_statepoint(paths[1], [5.0, 4.0, 3.0, 2.0, 1.0], 2)
+
+    output = merge_statepoints(paths, output=str(tmp_path / "merged.h5"), chunk_rows=2)
+    with h5py.File(output, 'r') as f:
+        results = f['tallies/tally 1/results'][()]
+        np.testing.assert_allclose(results[:, 0, 0], [6.0] * 5)
+        np.testing.assert_allclose(results[:, 0, 1], [26.0, 20.0, 18.0, 20.0, 26.0])
+        assert f['tallies/tally 1/n_realizations'][()] == 5
+        assert f['n_realizations'][()] == 5
+        assert f.attrs['ensemble_replicas'] == 2
@@ -0,0 +1,10 @@
+from mpi_launcher import choose_layout
+
+
+def test_one_rank_per_socket():
+    assert choose_layout(2, 64) == (4, 32)
+    assert choose_layout(1, 8, sockets_per_node=1) == (1, 8)
+
+
+def test_at_least_one_thread():
+    assert choose_layout(1, 1) == (2, 1)
@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from schedule import Schedule, transported_steps, fill_cached, save_transport_flags, load_transport_flags
+
+
+def test_compile_merges_outages_and_caches_repeat_pulses():
+    schedule = Schedule().pulses(3, on=1.0, off=1.0, rate=2.0, resolve=True).outage(5.0)
+
+    timesteps, rates, transport = schedule.compile()
+    assert timesteps == [1.0, 1.0, 1.0, 1.0, 1.0, 6.0]
+    assert rates == [2.0, 0.0, 2.0, 0.0, 2.0, 0.0]
+    assert transport == [True, False, False, False, False, False]
+
+
+def test_compile_refreshes_cached_rates():
+    schedule = Schedule().pulses(3, on=1.0, off=1.0, rate=2.0, resolve=True)
+
+    _, _, transport = schedule.compile(refresh_after=1.5)
+    assert transport == [True, False, True, False, True, False]
+
+
+def test_unresolved_pulses_average_the_rate():
+    schedule = Schedule().pulses(10, on=1.0, off=9.0, rate=1.0e15, max_step=30.0)
+
+    timesteps, rates, transport = schedule.compile()
+    assert timesteps == [25.0] * 4
+    assert rates == [1.0e14] * 4
+    assert transport == [True, False, False, False]
+
+
+def test_ramp_uses_midpoint_rates():
+    timesteps, rates, _ = Schedule().ramp(4.0, 0.0, 4.0, n_steps=2).compile()
+    assert timesteps == [2.0, 2.0]
+    assert rates == [1.0, 3.0]
+
+
+def test_transported_steps():
+    # 4 steps + end of life; the end-of-life solve has no flag
+    source_rates = [1.0, 1.0, 0.0, 1.0, 1.0]
+
+    assert transported_steps(source_rates).tolist() == [True, True, False, True, True]
+    assert transported_steps(source_rates, [True, False, False, True]).tolist() == [True, False, False, True, True]
+
+
+def test_fill_cached_scales_by_source_rate():
+    values = [[2.0], [0.0], [0.0], [0.0]]
+    source_rates = [1.0, 2.0, 0.0, 1.0]
+    transported = [True, False, False, False]
+
+    np.testing.assert_allclose(fill_cached(values, source_rates, transported), [[2.0], [4.0], [0.0], [2.0]])
+
+
+def test_transport_flags_round_trip(tmp_path):
+    path = tmp_path / "schedule_steps.json"
+    save_transport_flags(np.array([True, False, True]), path)
+    assert load_transport_flags(path) == [True, False, True]
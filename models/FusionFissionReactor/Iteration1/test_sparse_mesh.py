@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("h5py")
+pytest.importorskip("openmc")
+
+from sparse_mesh import save_sparse, load_sparse, to_dense, voxel_centers, merge_sparse
+
+
+def make_sparse(index, sums, n_realizations=4):
+    # 2 x 2 x 1 mesh of unit voxels; every realization scored the same, so std = 0
+    sums = np.asarray(sums, dtype=float).reshape(-1, 1)
+    return {
+        'dimension': np.array([2, 2, 1]),
+        'lower_left': np.zeros(3),
+        'upper_right': np.array([2.0, 2.0, 1.0]),
+        'scores': np.array(['heating']),
+        'nuclides': np.array(['total']),
+        'n_realizations': n_realizations,
+        'index': np.asarray(index),
+        'sum': sums,
+        'sum_sq': sums**2 / n_realizations,
+    }
+
+
+def test_round_trip(tmp_path):
+    sparse = make_sparse([1, 3], [4.0, 8.0])
+    path = tmp_path / "heating.npz"
+    save_sparse(sparse, path)
+
+    loaded = load_sparse(path)
+    assert loaded['n_realizations'] == 4
+    for key in ('dimension', 'lower_left', 'upper_right', 'scores', 'nuclides', 'index', 'sum', 'sum_sq'):
+        np.testing.assert_array_equal(loaded[key], sparse[key])
+
+
+def test_dense_and_centers_are_x_fastest():
+    sparse = make_sparse([1, 3], [4.0, 8.0])
+
+    np.testing.assert_allclose(to_dense(sparse)[:, :, 0], [[0.0, 0.0], [1.0, 2.0]])
+    np.testing.assert_allclose(to_dense(sparse, stat='std_dev'), 0.0)
+    np.testing.assert_allclose(voxel_centers(sparse), [[1.5, 0.5, 0.5], [1.5, 1.5, 0.5]])
+
+
+def test_merge_pools_over_union_of_voxels():
+    merged = merge_sparse([make_sparse([1, 3], [4.0, 8.0]), make_sparse([0, 3], [2.0, 2.0])])
+
+    np.testing.assert_array_equal(merged['index'], [0, 1, 3])
+    np.testing.assert_allclose(merged['sum'][:, 0], [2.0, 4.0, 10.0])
+    assert merged['n_realizations'] == 8
@@ -0,0 +1,95 @@
+import openmc
+import openmc.deplete
+import csv
+import json
+import os
+import resource
+import time
+
+TIMELINE_FIELDS = ['run', 'step', 'phase', 'seconds', 'rate', 'peak_rss_mb']
+
+
+def peak_rss_mb():
+    """
+    Peak resident memory [MB] of this process and of finished child processes
+    (openmc subprocesses report through RUSAGE_CHILDREN). Linux reports KB.
+    """
+
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024.0
+
+
+class Timeline:
+    """
+    Collects phase timings for one model run as a flat list of events.
+
+    - begin(phase)/end(phase) bracket script sections (model build, XML export, ...)
+    - add_statepoint() pulls openmc's own runtime breakdown from a statepoint
+    - add_depletion() pulls the per-step burnup matrix solve times
+    - write() saves <name>.json and <name>.csv for sweep aggregation
+    """
+
+    def __init__(self, run_name):
+        self.run_name = run_name
+        self.events = []
+        self._open = {}
+
+    def add(self, phase, seconds, step=None, rate=None):
+        self.events.append({'run': self.run_name, 'step': step, 'phase': phase, 'seconds': seconds,
+                            'rate': rate, 'peak_rss_mb': peak_rss_mb()})
+
+    def begin(self, phase):
+        self._open[phase] = time.perf_counter()
+
+    def end(self, phase, step=None):
+        self.add(phase, time.perf_counter() - self._open.pop(phase), step=step)
+
+    def add_statepoint(self, path, step=None):
+        # openmc's runtime dictionary, plus particles/sec for inactive and active batches
+        with openmc.StatePoint(path, autolink=False) as sp:
+            runtime = dict(sp.runtime)
+            particles = sp.n_particles
+            n_inactive = sp.n_inactive or 0
+            n_active = sp.n_batches - n_inactive
+
+        self.add('initialization', runtime.get('total initialization'), step=step)
+        self.add('cross section load', runtime.get('reading cross sections'), step=step)
+        for phase, batches in (('inactive batches', n_inactive), ('active batches', n_active)):
+            seconds = runtime.get(phase)
+            rate = particles * batches / seconds if seconds and batches else None
+            self.add(f'transport ({phase})', seconds, step=step, rate=rate)
+        self.add('tally reduction', runtime.get('accumulating tallies'), step=step)
+        self.add('statepoint write', runtime.get('writing statepoints'), step=step)
+
+    def add_depletion(self, results_path="depletion_results.h5", statepoint_pattern="openmc_simulation_n{}.h5"):
+        results = openmc.deplete.Results(results_path)
+        for step, step_result in enumerate(results):
+            self.add('depletion solve', float(step_result.proc_time), step=step)
+            statepoint = statepoint_pattern.format(step)
+            if os.path.exists(statepoint):
+                self.add_statepoint(statepoint, step=step)
+
+    def write(self, basename=None):
+        basename = basename or f"timeline_{self.run_name}"
+        with open(basename + '.json', 'w') as f:
+            json.dump(self.events, f, indent=2)
+        with open(basename + '.csv', 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=TIMELINE_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.events)
+        return basename + '.json', basename + '.csv'
+
+
+def aggregate(csv_paths):
+    """
+    Combines timeline CSVs from a sweep into one table of total seconds per
+    phase and run, sorted so the biggest bottleneck is on top.
+    """
+
+    import pandas as pd
+
+    frame = pd.concat([pd.read_csv(p) for p in csv_paths], ignore_index=True)
+    table = frame.pivot_table(index='phase', columns='run', values='seconds', aggfunc='sum')
+    table['total'] = table.sum(axis=1)
+    return table.sort_values('total', ascending=False)
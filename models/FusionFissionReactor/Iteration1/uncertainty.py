@@ -0,0 +1,50 @@
+import numpy as np
+
+# Tally bins of one run and separate depletion steps are treated as
+# independent, as openmc does when it sums tally bins.
+
+
+def quadrature(std, axis=None):
+    """
+    Standard deviation of a sum of independent terms: sqrt(sum std^2).
+    """
+
+    return np.sqrt(np.sum(np.square(std), axis=axis))
+
+
+def weighted_std(std, weights, axis=-1):
+    """
+    Standard deviation of sum(w * x) for independent x with given std.
+    """
+
+    return np.sqrt(np.sum(np.square(std * weights), axis=axis))
+
+
+def cumulative_std(std, dt):
+    """
+    Standard deviation of the running time integral cumsum(x * dt) when every
+    step's x comes from an independent transport solve.
+    """
+
+    return np.sqrt(np.cumsum(np.square(std * dt)))
+
+
+def relative(mean, std):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(mean != 0, np.abs(std / mean), 0.0)
+
+
+def particles_needed(rel_err, target_rel_err, particles):
+    """
+    Histories needed to reach target_rel_err, using the 1/sqrt(N) scaling of
+    the relative error (particles = histories behind rel_err).
+    """
+
+    rel_err = np.asarray(rel_err, float)
+    return np.where(rel_err > 0, particles * (rel_err / target_rel_err)**2, particles)
+
+
+def fmt(mean, std):
+    # "1.234e+05 +/- 2.1e+03 (1.7%)"
+    rel = float(relative(mean, std))
+    return f"{mean:.4e} +/- {std:.1e} ({100.0 * rel:.1f}%)"
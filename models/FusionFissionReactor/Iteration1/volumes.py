@@ -0,0 +1,96 @@
+import openmc
+import hashlib
+import json
+import os
+import tempfile
+
+VOLUME_CACHE_DIR = "volume_cache"
+
+
+def geometry_hash(geometry, materials):
+    """
+    Returns a short SHA-256 hash of the exported geometry + materials XML.
+
+    Two models with the same hash have identical surfaces, cells, fills and
+    compositions, so any cached geometry-derived result can be reused.
+    """
+
+    digest = hashlib.sha256()
+    with tempfile.TemporaryDirectory() as tmp:
+        geometry.export_to_xml(os.path.join(tmp, 'geometry.xml'))
+        materials.export_to_xml(os.path.join(tmp, 'materials.xml'))
+        for name in ('geometry.xml', 'materials.xml'):
+            with open(os.path.join(tmp, name), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def compute_volumes(geometry, materials, samples=1_000_000, rel_err=None, threads=None,
+                    lower_left=None, upper_right=None, cache_dir=VOLUME_CACHE_DIR, cached_only=False):
+    """
+    Runs an OpenMC stochastic volume calculation for every cell and material.
+
+    - Cells and materials are sampled in a single openmc run (OpenMP threaded)
+    - rel_err: optional relative-error trigger instead of a fixed sample count
+    - lower_left/upper_right: sampling box, defaults to geometry.bounding_box
+    - Results are cached in cache_dir by geometry hash
+    - cached_only: return None on a cache miss instead of running openmc
+    - Returns: {'cells': {id: (mean, std)}, 'materials': {id: (mean, std)}}
+    """
+
+    key = geometry_hash(geometry, materials)
+    cache_file = os.path.join(cache_dir, f"volumes_{key}.json")
+    if os.path.exists(cache_file):
+        print(f"Using cached volumes {cache_file}")
+        with open(cache_file) as f:
+            cached = json.load(f)
+        return {kind: {int(uid): tuple(v) for uid, v in vols.items()}
+                for kind, vols in cached.items()}
+    if cached_only:
+        return None
+
+    if lower_left is None or upper_right is None:
+        lower_left, upper_right = geometry.bounding_box
+
+    cells = [c for c in geometry.get_all_cells().values() if c.fill is not None]
+    mats = list(materials)
+    calcs = [openmc.VolumeCalculation(cells, samples, lower_left, upper_right),
+             openmc.VolumeCalculation(mats, samples, lower_left, upper_right)]
+    if rel_err is not None:
+        for calc in calcs:
+            calc.set_trigger(rel_err, 'rel_err')
+
+    settings = openmc.Settings()
+    settings.run_mode = 'volume'
+    settings.volume_calculations = calcs
+    model = openmc.Model(geometry=geometry, materials=materials, settings=settings)
+
+    volumes = {'cells': {}, 'materials': {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Running stochastic volume calculation ({samples} samples)...")
+        model.calculate_volumes(threads=threads, cwd=tmp, apply_volumes=False)
+        # openmc writes one volume_<n>.h5 per calculation, numbered from 1
+        for n, kind in enumerate(('cells', 'materials'), start=1):
+            result = openmc.VolumeCalculation.from_hdf5(os.path.join(tmp, f"volume_{n}.h5"))
+            for uid, vol in result.volumes.items():
+                volumes[kind][uid] = (float(vol.nominal_value), float(vol.std_dev))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache_file, 'w') as f:
+        json.dump(volumes, f, indent=2)
+    return volumes
+
+
+def apply_volumes(geometry, materials, volumes):
+    """
+    Injects computed volumes into Cell.volume and Material.volume
+    (Material.volume is what depletion and flux normalization read).
+    """
+
+    cells = geometry.get_all_cells()
+    for uid, (mean, _) in volumes['cells'].items():
+        if uid in cells:
+            cells[uid].volume = mean
+    for mat in materials:
+        if mat.id in volumes['materials']:
+            mat.volume = volumes['materials'][mat.id][0]
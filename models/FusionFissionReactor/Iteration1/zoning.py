@@ -0,0 +1,131 @@
+import openmc
+import numpy as np
+import json
+import math
+
+ZONES_FILE = "zones.json"
+
+
+def _shell_surfaces(cell):
+    # (inner, outer) origin-centred spheres of a +inner & -outer region
+    inner = outer = None
+    if isinstance(cell.region, openmc.Intersection):
+        for hs in cell.region:
+            if not (isinstance(hs, openmc.Halfspace) and isinstance(hs.surface, openmc.Sphere)):
+                return None
+            s = hs.surface
+            if (s.x0, s.y0, s.z0) != (0.0, 0.0, 0.0):
+                return None
+            if hs.side == '+':
+                inner = s
+            else:
+                outer = s
+    if inner is None or outer is None:
+        return None
+    return inner, outer
+
+
+def zone_radii(r_in, r_out, n_zones, spacing='equal-thickness'):
+    """
+    Zone boundaries between r_in and r_out. 'equal-volume' gives thinner zones
+    towards the outside; 'equal-thickness' resolves the inner breeding peak.
+    """
+
+    if spacing == 'equal-volume':
+        return np.cbrt(np.linspace(r_in**3, r_out**3, n_zones + 1))
+    return np.linspace(r_in, r_out, n_zones + 1)
+
+
+def zone_shell(geometry, materials, cell, n_zones, spacing='equal-thickness'):
+    """
+    Splits a spherical-shell cell into n_zones concentric sub-shells.
+
+    The innermost zone keeps the original material (so its id, e.g. 1 for the
+    spent fuel, stays valid); the others get clones. Every zone material is
+    depletable and carries its exact shell volume.
+
+    - Returns: list of zone dicts {'material', 'cell', 'r_in', 'r_out', 'volume'}
+    """
+
+    shell = _shell_surfaces(cell)
+    if shell is None:
+        raise ValueError(f"Cell {cell.id} is not a +sphere & -sphere shell about the origin")
+    inner, outer = shell
+    radii = zone_radii(inner.r, outer.r, n_zones, spacing)
+    surfaces = [inner] + [openmc.Sphere(r=r) for r in radii[1:-1]] + [outer]
+
+    material = cell.fill
+    base_name = material.name or material.id
+    universe = geometry.root_universe
+    universe.remove_cell(cell)
+
+    zones = []
+    for i in range(n_zones):
+        zone_material = material if i == 0 else material.clone()
+        zone_material.name = f"{base_name} zone {i}"
+        zone_material.depletable = True
+        volume = (4.0 / 3.0) * math.pi * (radii[i + 1]**3 - radii[i]**3)
+        zone_material.volume = volume
+        if i > 0:
+            materials.append(zone_material)
+
+        zone_cell = openmc.Cell(name=f"{cell.name or cell.id}_zone{i}", fill=zone_material,
+                                region=+surfaces[i] & -surfaces[i + 1])
+        zone_cell.volume = volume
+        universe.add_cell(zone_cell)
+        zones.append({'material': zone_material, 'cell': zone_cell, 'r_in': float(radii[i]),
+                      'r_out': float(radii[i + 1]), 'volume': volume})
+    return zones
+
+
+def zone_depletable_shells(geometry, materials, n_zones, targets=None, spacing='equal-thickness'):
+    """
+    Zones every root-universe shell filled with one of `targets` (default:
+    materials marked depletable). Returns: {original material id: zones}
+    """
+
+    target_ids = {m.id for m in (targets if targets is not None else [m for m in materials if m.depletable])}
+    shells = [c for c in geometry.root_universe.cells.values()
+              if isinstance(c.fill, openmc.Material) and c.fill.id in target_ids and _shell_surfaces(c)]
+    return {cell.fill.id: zone_shell(geometry, materials, cell, n_zones, spacing) for cell in shells}
+
+
+def save_zones(zoned, path=ZONES_FILE):
+    with open(path, 'w') as f:
+        json.dump({str(mat_id): [{'material': z['material'].id, 'r_in': z['r_in'], 'r_out': z['r_out'],
+                                  'volume': z['volume']} for z in zones]
+                   for mat_id, zones in zoned.items()}, f, indent=2)
+
+
+def load_zones(path=ZONES_FILE):
+    """
+    Returns: {original material id: list of zone dicts with material ids}
+    """
+
+    with open(path) as f:
+        return {int(k): v for k, v in json.load(f).items()}
+
+
+def radial_inventory(results, zones, nuclides, mass_units='g'):
+    """
+    Radial inventory profiles of one zoned shell.
+
+    - zones: one entry of load_zones()
+    - Returns: (r_mid, times_s, {nuclide: mass array (n_steps, n_zones)},
+      {nuclide: density array (n_steps, n_zones) in mass_units/cm^3})
+    """
+
+    r_mid = np.array([0.5 * (z['r_in'] + z['r_out']) for z in zones])
+    volumes = np.array([z['volume'] for z in zones])
+    times = np.asarray(results.get_times(time_units='s'))
+    mass, density = {}, {}
+    for nuc in nuclides:
+        columns = []
+        for z in zones:
+            try:
+                columns.append(results.get_mass(str(z['material']), nuc, mass_units=mass_units)[1])
+            except (KeyError, ValueError):
+                columns.append(np.zeros(len(times)))
+        mass[nuc] = np.column_stack(columns)
+        density[nuc] = mass[nuc] / volumes[None, :]
+    return r_mid, times, mass, density
@@ -1,40 +1,50 @@
 import openmc
 import argparse
+import numpy as np
 import glob
 import os
 
-# --- 1. Define materials ---
-fuel = openmc.Material(name="UO2 fuel")
-fuel.add_element('U', 1, enrichment=90)
-#fuel.add_element('O', 2)
-#fuel.add_element('U', 1)
-fuel.set_density('g/cm3', 10.0)
-
-water = openmc.Material(name="Water")
-water.add_element('H', 2)
-water.add_element('O', 1)
-water.set_density('g/cm3', 1.0)
-#water.add_s_alpha_beta('c_H_in_H2O')
-
-materials = openmc.Materials([fuel, water])
-
-# --- 2. Geometry ---
-# --- 2. Geometry (bounded with an outer vacuum sphere) ---
-fuel_region = -openmc.Sphere(r=100, boundary_type='transmission')  # inner sphere (finite surface)
-fuel_cell   = openmc.Cell(region=fuel_region, fill=fuel)
-
-# Outer vacuum boundary that closes the model
-outer_sphere = openmc.Sphere(r=200.0, boundary_type='vacuum')
-mod_region   = +openmc.Sphere(r=100) & -outer_sphere
-mod_cell     = openmc.Cell(region=mod_region, fill=water)
-
-# --- 3. Settings ---
-settings = openmc.Settings()
-# Use temperature interpolation (don’t require windowed-multipole data)
-settings.temperature = {'method': 'interpolation'}
-settings.batches = 20
-settings.inactive = 5
-settings.particles = 1000
+import response_matrix as rm
+import source_bank
+
+
+# Natural uranium: a 100 cm sphere of it stays subcritical even inside the water
+# shell, so it is the default assembly of the --response-matrix mode
+NATURAL_ENRICHMENT = 0.711
+
+
+def build_geometry(enrichment=90.0):
+	"""U sphere (r = 100 cm, 90% enriched by default) in a water shell (r = 200 cm) with a vacuum boundary.
+
+	Returns (geometry, materials, fuel_cell); also used by the benchmark suite.
+	"""
+	# --- 1. Define materials ---
+	fuel = openmc.Material(name="UO2 fuel")
+	fuel.add_element('U', 1, enrichment=enrichment)
+	#fuel.add_element('O', 2)
+	#fuel.add_element('U', 1)
+	fuel.set_density('g/cm3', 10.0)
+
+	water = openmc.Material(name="Water")
+	water.add_element('H', 2)
+	water.add_element('O', 1)
+	water.set_density('g/cm3', 1.0)
+	#water.add_s_alpha_beta('c_H_in_H2O')
+
+	materials = openmc.Materials([fuel, water])
+
+	# --- 2. Geometry ---
+	# --- 2. Geometry (bounded with an outer vacuum sphere) ---
+	fuel_region = -openmc.Sphere(r=100, boundary_type='transmission')  # inner sphere (finite surface)
+	fuel_cell   = openmc.Cell(region=fuel_region, fill=fuel)
+
+	# Outer vacuum boundary that closes the model
+	outer_sphere = openmc.Sphere(r=200.0, boundary_type='vacuum')
+	mod_region   = +openmc.Sphere(r=100) & -outer_sphere
+	mod_cell     = openmc.Cell(region=mod_region, fill=water)
+	geometry = openmc.Geometry([fuel_cell, mod_cell])
+	return geometry, materials, fuel_cell
+
 
 # --- Source definition ---
 # Default: isotropic, monoenergetic point source at the origin (2 MeV)
@@ -62,65 +72,116 @@ def build_source(energy_mev: float = 2.0, coords=(0.0, 0.0, 0.0), hemisphere: bo
 	energy = openmc.stats.Discrete([energy_ev], [1.0])
 	return openmc.Source(space=space, angle=angle, energy=energy)
 
-# Parse optional command-line args so you can run different point sources easily
-parser = argparse.ArgumentParser(description='Run OpenMC test with a configurable point source')
-parser.add_argument('--energy-mev', type=float, default=2.45, help='Monoenergetic source energy in MeV (default: 2.45 MeV)')
-parser.add_argument('--x', type=float, default=0.0, help='X coordinate of the point source in cm')
-parser.add_argument('--y', type=float, default=0.0, help='Y coordinate of the point source in cm')
-parser.add_argument('--z', type=float, default=0.0, help='Z coordinate of the point source in cm')
-parser.add_argument('--hemisphere', action='store_false', help='Limit angular distribution to a hemisphere (forward relative to reference_uvw)')
-parser.add_argument('--refx', type=float, default=0.0, help='Reference direction x-component for hemisphere (default: 0)')
-parser.add_argument('--refy', type=float, default=0.0, help='Reference direction y-component for hemisphere (default: 0)')
-parser.add_argument('--refz', type=float, default=1.0, help='Reference direction z-component for hemisphere (default: 1)')
-parser.add_argument('--source-rate', type=float, default=1e14, help='Physical source emission rate in neutrons/sec (default: 1e12)')
-parser.add_argument('--energy-per-fission-mev', type=float, default=200.0, help='Energy released per fission in MeV (default: 200 MeV)')
-args, _ = parser.parse_known_args()
-
-settings.source = build_source(args.energy_mev, (args.x, args.y, args.z), hemisphere=args.hemisphere, reference_uvw=(args.refx, args.refy, args.refz))
-
-# Print mapping from simulated histories to physical neutrons/sec
-n_sim = settings.particles * (settings.batches - settings.inactive)
-S = args.source_rate
-print(f'Total simulated source histories: {n_sim}')
-print(f'Physical source rate S = {S:.3e} n/s')
-print(f'Each simulated particle represents S / N_sim = {S / n_sim:.6e} n/s')
-
-# --- 4. Export and run ---
-# build the geometry and export all XML inputs
-geometry = openmc.Geometry([fuel_cell, mod_cell])
-materials.export_to_xml()
-geometry.export_to_xml()
-settings.export_to_xml()
-
-# --- Tallies: add a fission tally for the fuel cell so we can compute power ---
-tally = openmc.Tally(name='fission_rate')
-tally.filters = [openmc.CellFilter(fuel_cell)]
-tally.scores = ['fission']
-openmc.Tallies([tally]).export_to_xml()
-
-openmc.run()
-
-# After the run, read the latest statepoint and extract the fission tally
-sp_files = glob.glob('statepoint.*.h5')
-if sp_files:
-	sp = max(sp_files, key=os.path.getmtime)
-	print(f'Reading statepoint: {sp}')
-	s = openmc.StatePoint(sp)
-	try:
-		t = s.get_tally(name='fission_rate')
-		# mean is per source particle simulated
-		mean = t.mean.flatten()[0]
-		n_sim = settings.particles * (settings.batches - settings.inactive)
-		S = args.source_rate
-		fissions_per_s = mean * S
-		# energy per fission (MeV -> J)
-		e_fiss_J = args.energy_per_fission_mev * 1.0e6 * 1.602176634e-19
-		power_W = fissions_per_s * e_fiss_J
-		print(f'Fission rate (per particle): {mean:.6e}')
-		print(f'Fissions/sec (for S={S:.3e} n/s): {fissions_per_s:.6e} 1/s')
-		print(f'Estimated power produced: {power_W:.6e} W = {power_W/1e6:.6f} MW')
-	except Exception as e:
-		print('Could not read fission tally from statepoint:', e)
-else:
-	print('No statepoint file found; cannot compute power.')
 
+if __name__ == "__main__":
+	# --- 3. Settings ---
+	settings = openmc.Settings()
+	# Use temperature interpolation (don’t require windowed-multipole data)
+	settings.temperature = {'method': 'interpolation'}
+	settings.batches = 20
+	settings.inactive = 5
+	settings.particles = 1000
+
+	# Parse optional command-line args so you can run different point sources easily
+	parser = argparse.ArgumentParser(description='Run OpenMC test with a configurable point source')
+	parser.add_argument('--energy-mev', type=float, default=2.45, help='Monoenergetic source energy in MeV (default: 2.45 MeV)')
+	parser.add_argument('--x', type=float, default=0.0, help='X coordinate of the point source in cm')
+	parser.add_argument('--y', type=float, default=0.0, help='Y coordinate of the point source in cm')
+	parser.add_argument('--z', type=float, default=0.0, help='Z coordinate of the point source in cm')
+	parser.add_argument('--hemisphere', action='store_false', help='Limit angular distribution to a hemisphere (forward relative to reference_uvw)')
+	parser.add_argument('--refx', type=float, default=0.0, help='Reference direction x-component for hemisphere (default: 0)')
+	parser.add_argument('--refy', type=float, default=0.0, help='Reference direction y-component for hemisphere (default: 0)')
+	parser.add_argument('--refz', type=float, default=1.0, help='Reference direction z-component for hemisphere (default: 1)')
+	parser.add_argument('--source-rate', type=float, default=1e14, help='Physical source emission rate in neutrons/sec (default: 1e12)')
+	parser.add_argument('--energy-per-fission-mev', type=float, default=200.0, help='Energy released per fission in MeV (default: 200 MeV)')
+	parser.add_argument('--response-matrix', action='store_true', help='One fixed-source run binned by source energy group instead of a single energy; needs a subcritical assembly, so it defaults to natural uranium')
+	parser.add_argument('--enrichment', type=float, default=None, help='U-235 enrichment of the sphere in wt%% (default: 90, or natural uranium with --response-matrix)')
+	parser.add_argument('--groups', type=int, default=50, help='Number of log-spaced source energy groups for --response-matrix (default: 50)')
+	parser.add_argument('--cold-start', action='store_true', help='Ignore any saved fission source bank (the converged bank is still saved)')
+	parser.add_argument('--fold-energies-mev', type=float, nargs='+', default=[14.1, 2.45], help='Line energies to fold with the response matrix (default: D-T 14.1, D-D 2.45)')
+	args, _ = parser.parse_known_args()
+
+	if args.enrichment is None:
+		args.enrichment = NATURAL_ENRICHMENT if args.response_matrix else 90.0
+	geometry, materials, fuel_cell = build_geometry(args.enrichment)
+	print(f'U sphere enrichment: {args.enrichment:g} wt%')
+
+	settings.source = build_source(args.energy_mev, (args.x, args.y, args.z), hemisphere=args.hemisphere, reference_uvw=(args.refx, args.refy, args.refz))
+
+	if args.response_matrix:
+		# Fixed-source response per source-energy group. Only a subcritical assembly
+		# has one (the 90% enriched sphere is supercritical), so refuse unless a quick
+		# eigenvalue run says k < 1, e.g. with a higher --enrichment
+		try:
+			k, k_std = rm.check_subcritical(geometry, materials, (args.x, args.y, args.z))
+		except RuntimeError as e:
+			raise SystemExit(f'--response-matrix refused: {e}')
+		print(f'Subcritical check: k-eff = {k:.4f} +/- {k_std:.4f}')
+		group_edges = rm.source_groups(n_groups=args.groups)
+		angle = build_source(coords=(args.x, args.y, args.z), hemisphere=args.hemisphere, reference_uvw=(args.refx, args.refy, args.refz)).angle
+		settings.run_mode = 'fixed source'
+		settings.inactive = 0
+		settings.source = rm.build_group_sources(group_edges, (args.x, args.y, args.z), angle)
+
+	bank = not args.response_matrix
+	if bank:
+		# Reuse the converged fission source of an earlier run of this (or a perturbed) model
+		bank_key = source_bank.warm_start(settings, geometry, materials, family='NeutronSinU', reuse=not args.cold_start)
+
+	# Print mapping from simulated histories to physical neutrons/sec
+	n_sim = settings.particles * (settings.batches - settings.inactive)
+	S = args.source_rate
+	print(f'Total simulated source histories: {n_sim}')
+	print(f'Physical source rate S = {S:.3e} n/s')
+	print(f'Each simulated particle represents S / N_sim = {S / n_sim:.6e} n/s')
+
+	# --- 4. Export and run ---
+	# export all XML inputs
+	materials.export_to_xml()
+	geometry.export_to_xml()
+	settings.export_to_xml()
+
+	# --- Tallies: add a fission tally for the fuel cell so we can compute power ---
+	tally = openmc.Tally(name='fission_rate')
+	tally.filters = [openmc.CellFilter(fuel_cell)]
+	tally.scores = ['fission']
+	tallies = [tally]
+	if args.response_matrix:
+		tallies.append(rm.response_tally(fuel_cell, args.groups))
+	openmc.Tallies(tallies).export_to_xml()
+
+	openmc.run()
+
+	# After the run, read the latest statepoint and extract the fission tally
+	sp_files = glob.glob('statepoint.*.h5')
+	if sp_files:
+		sp = max(sp_files, key=os.path.getmtime)
+		print(f'Reading statepoint: {sp}')
+		s = openmc.StatePoint(sp)
+		try:
+			t = s.get_tally(name='fission_rate')
+			# mean is per source particle simulated
+			mean = t.mean.flatten()[0]
+			n_sim = settings.particles * (settings.batches - settings.inactive)
+			S = args.source_rate
+			fissions_per_s = mean * S
+			# energy per fission (MeV -> J)
+			e_fiss_J = args.energy_per_fission_mev * 1.0e6 * 1.602176634e-19
+			power_W = fissions_per_s * e_fiss_J
+			print(f'Fission rate (per particle): {mean:.6e}')
+			print(f'Fissions/sec (for S={S:.3e} n/s): {fissions_per_s:.6e} 1/s')
+			print(f'Estimated power produced: {power_W:.6e} W = {power_W/1e6:.6f} MW')
+		except Exception as e:
+			print('Could not read fission tally from statepoint:', e)
+		if bank:
+			source_bank.save_bank(s, bank_key, family='NeutronSinU')
+		if args.response_matrix:
+			scores, R, R_std = rm.response_matrix(s, args.groups)
+			np.savez('response_matrix.npz', edges=group_edges, scores=scores, R=R, R_std=R_std)
+			print('Saved response_matrix.npz (fold any spectrum with rm.fold)')
+			for e_mev in args.fold_energies_mev:
+				resp, resp_std = rm.fold(R, R_std, rm.line_spectrum(group_edges, e_mev))
+				for name, v, dv in zip(scores, resp, resp_std):
+					print(f'{e_mev:6.2f} MeV line: {name} per source neutron = {v:.6e} +/- {dv:.1e}')
+	else:
+		print('No statepoint file found; cannot compute power.')
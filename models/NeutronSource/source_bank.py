@@ -0,0 +1,102 @@
+import openmc
+import numpy as np
+import json
+import os
+import shutil
+import sys
+import time
+
+# Banks are keyed by the same model hash as the volume cache
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'FusionFissionReactor', 'Iteration1'))
+from volumes import geometry_hash
+
+BANK_DIR = "source_bank"
+# 'overwrite' keeps only the final bank, written as source.h5
+SOURCEPOINT = {'write': True, 'separate': True, 'overwrite': True}
+
+
+def entropy_mesh(geometry, dimension=(8, 8, 8)):
+	"""Shannon-entropy mesh covering the model's bounding box."""
+	lower_left, upper_right = geometry.bounding_box
+	mesh = openmc.RegularMesh()
+	mesh.lower_left = lower_left
+	mesh.upper_right = upper_right
+	mesh.dimension = dimension
+	return mesh
+
+
+def converged_batch(entropy, n_sigma=3.0):
+	"""Number of leading batches to discard before the source entropy settles.
+
+	The reference band is the mean +/- n_sigma std of the second half of the
+	run; the source counts as converged from the first batch after which the
+	entropy never leaves the band.
+	"""
+	H = np.asarray(entropy, dtype=float)
+	tail = H[len(H) // 2:]
+	band = n_sigma * max(tail.std(), 1.0e-3 * abs(tail.mean()))
+	outside = np.flatnonzero(np.abs(H - tail.mean()) > band)
+	return int(outside[-1] + 1) if outside.size else 0
+
+
+def _load_index(bank_dir):
+	path = os.path.join(bank_dir, 'index.json')
+	if not os.path.exists(path):
+		return {}
+	with open(path) as f:
+		return json.load(f)
+
+
+def warm_start(settings, geometry, materials, family, bank_dir=BANK_DIR, min_inactive=1, reuse=True):
+	"""Start an eigenvalue run from a saved fission source bank if there is one.
+
+	- Exact model match (same hash): reload its bank, min_inactive batches
+	- Same family, different hash (perturbed model): reload the family's most
+	  recent bank with as many inactive batches as that run needed to converge
+	- Nothing saved, or reuse=False: keep settings.source/inactive (cold start)
+	The number of active batches is kept. Returns the model hash for save_bank.
+	"""
+	key = geometry_hash(geometry, materials)
+	settings.entropy_mesh = entropy_mesh(geometry)
+	settings.sourcepoint = dict(SOURCEPOINT)
+
+	index = _load_index(bank_dir) if reuse else {}
+	entry = index.get(key)
+	if entry is not None:
+		inactive = min_inactive
+	else:
+		family_entries = [e for e in index.values() if e['family'] == family]
+		if not family_entries:
+			print(f'No saved source bank for {family}: cold start with {settings.inactive} inactive batches')
+			return key
+		entry = max(family_entries, key=lambda e: e['time'])
+		inactive = min(max(min_inactive, entry['converged_batch']), settings.inactive)
+
+	active = settings.batches - settings.inactive
+	settings.source = openmc.FileSource(os.path.join(bank_dir, entry['file']))
+	settings.inactive = inactive
+	settings.batches = inactive + active
+	print(f"Warm start from {entry['file']}: {inactive} inactive batches")
+	return key
+
+
+def save_bank(statepoint, key, family, bank_dir=BANK_DIR, run_dir='.'):
+	"""Store the run's final source bank under its model hash.
+
+	Also records how many batches the source entropy took to converge and
+	warns if that exceeds the inactive batches actually discarded.
+	"""
+	sp = statepoint if isinstance(statepoint, openmc.StatePoint) else openmc.StatePoint(statepoint)
+	n_converge = converged_batch(sp.entropy)
+	if n_converge > sp.n_inactive:
+		print(f'WARNING: source entropy converged after {n_converge} batches but only '
+		      f'{sp.n_inactive} were inactive; rerun to converge from the saved bank')
+
+	os.makedirs(bank_dir, exist_ok=True)
+	shutil.copy(os.path.join(run_dir, 'source.h5'), os.path.join(bank_dir, f'{key}.h5'))
+	index = _load_index(bank_dir)
+	index[key] = {'family': family, 'file': f'{key}.h5', 'converged_batch': n_converge,
+	              'n_inactive': int(sp.n_inactive), 'time': time.time()}
+	with open(os.path.join(bank_dir, 'index.json'), 'w') as f:
+		json.dump(index, f, indent=2)
+	print(f'Saved source bank {key}.h5 (entropy converged after {n_converge} batches)')
@@ -2,8 +2,15 @@
 
 import numpy as np
 import h5py
+import os
+import sys
+import openmc
 import openmc.deplete
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'FusionFissionReactor', 'Iteration1'))
+from normalization import simulation_statepoints, simulation_step
+from uncertainty import fmt
+
 # ---- Config ----
 U238_MAT_NAME = "1"      # Or "U-238" if you re-ran with the named material
 MEV_PER_FISSION = 200.0  # (Good approximation for U-238/Pu-239)
@@ -43,6 +50,28 @@ fiss_rate = u238_fiss_rate + pu239_fiss_rate
 fissions_at_start   = float(fiss_rate[idx_start])
 fissions_at_10hours = float(fiss_rate[idx_end])
 
+# Depletion results keep only mean reaction rates; the relative error of each
+# step comes from the fission score of the reported material in the step
+# statepoint's tallies (U238 + Pu239 where the tally has nuclide bins)
+fiss_rel = np.zeros(len(fiss_rate))
+for path in simulation_statepoints():
+    i = simulation_step(path)
+    if i >= len(fiss_rate):
+        continue
+    with openmc.StatePoint(path, autolink=False) as sp:
+        for t in sp.tallies.values():
+            mat_filter = next((f for f in t.filters if isinstance(f, openmc.MaterialFilter)), None)
+            if 'fission' not in t.scores or t.derivative is not None or mat_filter is None \
+                    or int(U238_MAT_NAME) not in mat_filter.bins:
+                continue
+            nuclides = [n for n in ('U238', 'Pu239') if n in t.nuclides] or ['total']
+            t = t.get_slice(scores=['fission'], nuclides=nuclides, filters=[openmc.MaterialFilter],
+                            filter_bins=[(int(U238_MAT_NAME),)])
+            total = t.mean.sum()
+            fiss_rel[i] = np.sqrt((t.std_dev**2).sum()) / total if total > 0 else 0.0
+            break
+fiss_rate_std = fiss_rate * fiss_rel
+
 # Get mass
 try:
     t_mass, pu239_mass = results.get_mass(U238_MAT_NAME, 'Pu239')
@@ -53,6 +82,7 @@ except (ValueError, KeyError):
 # Calculate Instantaneous Power (Watts)
 power_at_start_calc = fissions_at_start * MEV_PER_FISSION * MEV_TO_JOULES
 power_at_10hours_calc = fissions_at_10hours * MEV_PER_FISSION * MEV_TO_JOULES
+power_std = fiss_rate_std * MEV_PER_FISSION * MEV_TO_JOULES
 
 # --- NEW: Calculate TOTALS over the 10-hour interval ---
 
@@ -66,28 +96,31 @@ duration_s   = time_end_s - time_start_s # Should be 36000.0
 avg_power_watts = (power_at_start_calc + power_at_10hours_calc) / 2.0
 total_energy_joules = avg_power_watts * duration_s
 total_energy_kwh = total_energy_joules / (3.6e6) # 3.6e6 J per kWh
+# Trapezoid of two independent estimates: std = duration/2 * sqrt(s0^2 + s1^2)
+total_energy_std = 0.5 * duration_s * float(np.hypot(power_std[idx_start], power_std[idx_end]))
 
 # 2. Total Fissions (a raw count)
 # We average the fission rate and multiply by time
 avg_fission_rate = (fissions_at_start + fissions_at_10hours) / 2.0
 total_fissions_count = avg_fission_rate * duration_s
+total_fissions_std = 0.5 * duration_s * float(np.hypot(fiss_rate_std[idx_start], fiss_rate_std[idx_end]))
 
 # 3. Total Pu-239 (already calculated)
 # total_pu239_grams is already the total created, since it starts at 0
 
 # --- Print All Results (Now with correct power) ---
 print("\n--- Instantaneous Rates (t = 0 hours) ---")
-print(f"Power Rate:       {power_at_start_calc:.4e} Watts (or {power_at_start_calc / 1000:.2f} kW)")
-print(f"Fission Rate:     {fissions_at_start:.4e} fissions/sec")
+print(f"Power Rate:       {fmt(power_at_start_calc, power_std[idx_start])} Watts (or {power_at_start_calc / 1000:.2f} kW)")
+print(f"Fission Rate:     {fmt(fissions_at_start, fiss_rate_std[idx_start])} fissions/sec")
 
 print("\n--- Instantaneous Rates (t = 1 year) ---")
-print(f"Power Rate:       {power_at_10hours_calc:.4e} Watts (or {power_at_10hours_calc / 1000:.2f} kW)")
-print(f"Fission Rate:     {fissions_at_10hours:.4e} fissions/sec")
+print(f"Power Rate:       {fmt(power_at_10hours_calc, power_std[idx_end])} Watts (or {power_at_10hours_calc / 1000:.2f} kW)")
+print(f"Fission Rate:     {fmt(fissions_at_10hours, fiss_rate_std[idx_end])} fissions/sec")
 
 print("\n--- TOTALS Accumulated over 1 ---")
-print(f"Total Energy Produced:  {total_energy_joules:.4e} Joules")
+print(f"Total Energy Produced:  {fmt(total_energy_joules, total_energy_std)} Joules")
 print(f"                       (or {total_energy_kwh:.2f} kWh)")
-print(f"Total Fissions (count): {total_fissions_count:.4e} fissions")
+print(f"Total Fissions (count): {fmt(total_fissions_count, total_fissions_std)} fissions")
 print(f"Total Pu-239 Created:   {total_pu239_grams:.6e} grams")
 
 
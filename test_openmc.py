@@ -1,4 +1,10 @@
 import openmc
+import os
+import sys
+
+# Fission source bank persistence lives with the NeutronSource models
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models', 'NeutronSource'))
+import source_bank
 
 # --- 1. Define materials ---
 fuel = openmc.Material(name="UO2 fuel")
@@ -34,6 +40,8 @@ settings.batches = 20
 settings.inactive = 5
 settings.particles = 1000
 settings.source = openmc.Source(space=openmc.stats.Point((0, 0, 0)))
+# Warm start from the saved source bank of an earlier run, if any
+bank_key = source_bank.warm_start(settings, geometry, materials, family='test_openmc')
 
 # --- 4. Export and run ---
 materials.export_to_xml()
@@ -41,4 +49,6 @@ geometry.export_to_xml()
 settings.export_to_xml()
 
 openmc.run()
+sp_path = f'statepoint.{settings.batches}.h5'
+source_bank.save_bank(sp_path, bank_key, family='test_openmc')
 